@@ -2,7 +2,6 @@ from fastapi import APIRouter, Depends, Query, UploadFile, File
 from sqlmodel import Session
 from typing import Optional
 from fastapi.responses import StreamingResponse
-from io import BytesIO
 import traceback
 
 from config.database import get_db
@@ -10,7 +9,7 @@ from services.paths import get_paths_service
 from services.base_crud import PageParams
 from schemas.paths import PathsCreate, PathsUpdate, PathConditions
 from utils.responses import success, server_error, bad_request
-from exceptions import NotFoundException
+from exceptions import NotFoundException, ValidationException
 
 router = APIRouter(prefix="/paths", tags=["路径管理"])
 
@@ -95,14 +94,13 @@ async def export_path_template(session: Session = Depends(get_db)):
     """导出路径 Excel 模板"""
     try:
         service = get_paths_service(session)
-        excel_bytes = service.export_template()
-        buffer = BytesIO(excel_bytes)
+        excel_chunks = service.export_template()
 
         # 文件名
         filename = f"bridge_path_template.xlsx"
 
         return StreamingResponse(
-            buffer,
+            excel_chunks,
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
@@ -120,8 +118,8 @@ async def import_path_excel(
     """
     try:
         # 验证文件类型
-        if not file.filename.endswith((".xlsx", ".xls")):
-            return bad_request("文件类型错误，请上传Excel文件(.xlsx或.xls格式)")
+        if not file.filename.lower().endswith(".xlsx"):
+            return bad_request("文件类型错误，请上传Excel文件(.xlsx格式)")
 
         # 读取Excel文件内容
         file_content = await file.read()
@@ -129,6 +127,8 @@ async def import_path_excel(
         service = get_paths_service(session)
         import_result = service.import_from_excel(file_content, file.filename)
         return success(import_result, "导入成功")
+    except ValidationException as e:
+        return bad_request(e.message)
     except Exception as e:
         traceback.print_exc()
         return server_error(f"导入 Excel 失败: {str(e)}")
@@ -19,8 +19,8 @@ router = APIRouter(prefix="/scores", tags=["评分管理"])
 
 @router.get("/list-weight", summary="查询权重分配列表")
 async def get_scores_list(
-    # page: int = Query(1, ge=1, description="页码"),
-    # size: int = Query(20, ge=1, le=100, description="每页数量"),
+    page: Optional[int] = Query(None, ge=1, description="页码（不传页码和每页数量时返回全部）"),
+    size: Optional[int] = Query(None, ge=1, le=100, description="每页数量"),
     bridge_instance_name: str = Query(..., description="桥梁实例名称"),
     bridge_type_id: int = Query(..., description="桥梁类型ID"),
     assessment_unit_instance_name: Optional[str] = Query(
@@ -43,16 +43,20 @@ async def get_scores_list(
         user_id=user_id,
     )
 
-    # page_params = PageParams(page=page, size=size)
+    # 传入页码或每页数量时按页查询，否则保持返回全部数据
+    page_params = None
+    if page is not None or size is not None:
+        page_params = PageParams(page=page or 1, size=size or 20)
 
-    items, total = service.get_score_list(request)
+    items, total = service.get_score_list(request, page_params)
 
     response_data = {
         "items": items,
         "total": total,
-        # "page": page,
-        # "size": size,
     }
+    if page_params:
+        response_data["page"] = page_params.page
+        response_data["size"] = page_params.size
 
     return success(response_data, "查询权重分配列表成功")
 
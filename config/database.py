@@ -27,7 +27,9 @@ engine = create_engine(
     pool_pre_ping=True,
     # echo=settings.ENVIRONMENT == "development",  # 输出SQL日志
     echo=False,  # 输出SQL日志
-    pool_recycle=3600,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
 )
 
 
@@ -24,6 +24,14 @@ class Settings(BaseSettings):
     MYSQL_DATABASE: str = "database"
     MYSQL_PORT: int = 3306
 
+    # 连接池配置
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_RECYCLE: int = 1800
+
+    # 导入配置
+    MAX_IMPORT_BYTES: int = 50 * 1024 * 1024
+
     @property
     def database_url(self) -> str:
         return f"mysql+pymysql://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}@{self.MYSQL_SERVER}:{self.MYSQL_PORT}/{self.MYSQL_DATABASE}"
@@ -107,12 +107,13 @@ class BridgePartWeight(Enum):
     @classmethod
     def get_weight_by_name(cls, part_name: str) -> Optional[float]:
         """根据部位名称获取权重"""
-        for item in cls:
-            if item.part_name == part_name:
-                return item.weight
-        return None
+        return _PART_WEIGHTS_BY_NAME.get(part_name)
 
     @classmethod
     def get_all_weights(cls) -> dict:
         """获取所有部位权重字典"""
         return {item.part_name: item.weight for item in cls}
+
+
+# 部位名称到权重的映射，模块加载时构建一次
+_PART_WEIGHTS_BY_NAME = BridgePartWeight.get_all_weights()
@@ -1,7 +1,8 @@
-from sqlmodel import Field, Index
+from sqlmodel import Field, Index, Text
 from typing import Optional
 
 from .base import BaseModel
+from .enums import ScalesType
 
 
 class Paths(BaseModel, table=True):
@@ -49,6 +50,74 @@ class Paths(BaseModel, table=True):
         default=None, foreign_key="bridge_quantities.id", description="定量描述ID"
     )
 
+    # 冗余的关联编码和名称，读取时无需再查询各基础表
+    category_code: Optional[str] = Field(
+        default=None, max_length=20, description="桥梁类别编码"
+    )
+    category_name: Optional[str] = Field(
+        default=None, sa_type=Text, description="桥梁类别名称"
+    )
+    assessment_unit_code: Optional[str] = Field(
+        default=None, max_length=20, description="评定单元编码"
+    )
+    assessment_unit_name: Optional[str] = Field(
+        default=None, sa_type=Text, description="评定单元名称"
+    )
+    bridge_type_code: Optional[str] = Field(
+        default=None, max_length=20, description="桥梁类型编码"
+    )
+    bridge_type_name: Optional[str] = Field(
+        default=None, sa_type=Text, description="桥梁类型名称"
+    )
+    part_code: Optional[str] = Field(default=None, max_length=20, description="部位编码")
+    part_name: Optional[str] = Field(default=None, sa_type=Text, description="部位名称")
+    structure_code: Optional[str] = Field(
+        default=None, max_length=20, description="结构类型编码"
+    )
+    structure_name: Optional[str] = Field(
+        default=None, sa_type=Text, description="结构类型名称"
+    )
+    component_type_code: Optional[str] = Field(
+        default=None, max_length=20, description="部件类型编码"
+    )
+    component_type_name: Optional[str] = Field(
+        default=None, sa_type=Text, description="部件类型名称"
+    )
+    component_form_code: Optional[str] = Field(
+        default=None, max_length=20, description="构件形式编码"
+    )
+    component_form_name: Optional[str] = Field(
+        default=None, sa_type=Text, description="构件形式名称"
+    )
+    disease_code: Optional[str] = Field(
+        default=None, max_length=20, description="病害类型编码"
+    )
+    disease_name: Optional[str] = Field(
+        default=None, sa_type=Text, description="病害类型名称"
+    )
+    scale_code: Optional[str] = Field(default=None, max_length=20, description="标度编码")
+    scale_name: Optional[str] = Field(default=None, sa_type=Text, description="标度名称")
+    quality_code: Optional[str] = Field(
+        default=None, max_length=20, description="定性描述编码"
+    )
+    quality_name: Optional[str] = Field(
+        default=None, sa_type=Text, description="定性描述名称"
+    )
+    quantity_code: Optional[str] = Field(
+        default=None, max_length=20, description="定量描述编码"
+    )
+    quantity_name: Optional[str] = Field(
+        default=None, sa_type=Text, description="定量描述名称"
+    )
+
+    # 冗余的标度详情
+    scale_type: Optional[ScalesType] = Field(default=None, description="标度类型")
+    scale_value: Optional[int] = Field(default=None, description="标度值")
+    min_value: Optional[int] = Field(default=None, description="范围最小值")
+    max_value: Optional[int] = Field(default=None, description="范围最大值")
+    unit: Optional[str] = Field(default=None, description="单位")
+    display_text: Optional[str] = Field(default=None, description="显示文本")
+
     # 索引配置
     __table_args__ = (
         # 单索引
@@ -67,6 +136,16 @@ class Paths(BaseModel, table=True):
         Index("idx_paths_category_bridge_type", "category_id", "bridge_type_id"),
         Index("idx_paths_unit_bridge_type", "assessment_unit_id", "bridge_type_id"),
         Index("idx_paths_bridge_disease", "bridge_type_id", "disease_id"),
+        # 评分构件数量统计索引
+        Index(
+            "idx_paths_component_count",
+            "bridge_type_id",
+            "part_id",
+            "component_type_id",
+            "component_form_id",
+            "is_active",
+            "structure_id",
+        ),
         # 路径索引
         Index(
             "idx_paths_full_hierarchy_active",
@@ -80,4 +159,20 @@ class Paths(BaseModel, table=True):
             "component_form_id",
             "disease_id",
         ),
+        # 唯一性校验索引（MySQL 不支持部分索引，将 is_active 放在首列）
+        Index(
+            "idx_paths_unique_combo",
+            "is_active",
+            "category_id",
+            "assessment_unit_id",
+            "bridge_type_id",
+            "part_id",
+            "structure_id",
+            "component_type_id",
+            "component_form_id",
+            "disease_id",
+            "scale_id",
+            "quality_id",
+            "quantity_id",
+        ),
     )
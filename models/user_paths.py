@@ -56,4 +56,13 @@ class UserPaths(BaseModel, table=True):
         # 业务查询索引
         Index("idx_user_paths_category_bridge", "category_id", "bridge_type_id"),
         Index("idx_user_paths_full_path", "category_id", "bridge_type_id", "part_id"),
+        # 评分级联选项分组索引
+        Index(
+            "idx_user_paths_cascade_options",
+            "user_id",
+            "is_active",
+            "bridge_instance_name",
+            "assessment_unit_instance_name",
+            "bridge_type_id",
+        ),
     )
@@ -59,6 +59,16 @@ class WeightReferences(BaseModel, table=True):
             "component_type_id",
             "part_id",
         ),
+        # 评分权重查询覆盖索引（按部位、部件类型排序，weight 在索引中无需回表）
+        Index(
+            "idx_weight_references_score_lookup",
+            "bridge_type_id",
+            "is_active",
+            "part_id",
+            "component_type_id",
+            "structure_id",
+            "weight",
+        ),
         # 唯一索引
         Index(
             "idx_weight_references_unique",
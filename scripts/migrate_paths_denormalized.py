@@ -0,0 +1,58 @@
+import sys
+import os
+from sqlmodel import Session
+from sqlalchemy import inspect, text
+
+# 添加项目根目录到路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.database import engine
+from models import Paths
+from services.path_cascade import get_path_cascade_service
+from services.paths import SCALE_DETAIL_FIELDS
+
+
+def add_missing_columns() -> None:
+    """为已有的 paths 表补充冗余字段"""
+    table = Paths.__table__
+    existing = {column["name"] for column in inspect(engine).get_columns("paths")}
+
+    with engine.begin() as conn:
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            column_type = column.type.compile(dialect=engine.dialect)
+            conn.execute(
+                text(f"ALTER TABLE paths ADD COLUMN {column.name} {column_type} NULL")
+            )
+            print(f"新增字段: {column.name} {column_type}")
+
+
+def backfill() -> None:
+    """根据各基础表回填 paths 表的冗余编码和名称"""
+    with Session(engine) as session:
+        cascade_service = get_path_cascade_service(session)
+
+        for table_name, field_name in cascade_service.table_field_mapping.items():
+            prefix = field_name[: -len("_id")]
+            assignments = [
+                f"p.{prefix}_code = r.code",
+                f"p.{prefix}_name = r.name",
+            ]
+            if table_name == "bridge_scales":
+                assignments.extend(f"p.{field} = r.{field}" for field in SCALE_DETAIL_FIELDS)
+
+            stmt = text(
+                f"UPDATE paths p JOIN {table_name} r ON p.{field_name} = r.id "
+                f"SET {', '.join(assignments)}"
+            )
+            result = session.execute(stmt)
+            print(f"回填 {table_name}: {result.rowcount} 条路径记录")
+
+        session.commit()
+
+
+if __name__ == "__main__":
+    add_missing_columns()
+    backfill()
+    print("paths 冗余字段迁移完成")
@@ -0,0 +1,30 @@
+import sys
+import os
+
+# 添加项目根目录到路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+
+from config.database import engine
+from models import Paths, UserPaths, WeightReferences
+
+
+def create_missing_indexes() -> None:
+    """
+    为已有的 paths、user_paths、weight_references 表补建模型中新增的索引
+    建完索引后执行 ANALYZE TABLE 刷新统计信息，便于优化器选用新索引
+    """
+    for model in (Paths, UserPaths, WeightReferences):
+        table = model.__table__
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+            print(f"索引已就绪: {index.name}")
+
+        with engine.connect() as conn:
+            conn.execute(text(f"ANALYZE TABLE {table.name}"))
+        print(f"统计信息已更新: {table.name}")
+
+
+if __name__ == "__main__":
+    create_missing_indexes()
@@ -4,10 +4,14 @@ from sqlalchemy import func, desc, asc, update
 from abc import ABC
 from datetime import datetime
 from pydantic import BaseModel, Field
+import logging
 
 from exceptions import NotFoundException, DuplicateException
 from services.code_generator import get_code_generator
 from services.path_cascade import get_path_cascade_service
+from utils.cache import cascade_options_cache, options_cache
+
+logger = logging.getLogger(__name__)
 
 # 泛型变量定义
 ModelType = TypeVar("ModelType", bound=SQLModel)  # 数据模型类型
@@ -59,8 +63,8 @@ class BaseCRUDService(Generic[ModelType, CreateSchemaType, UpdateSchemaType], AB
 
             result = self.session.exec(statement).first()
             return result
-        except Exception as e:
-            print(f"查询ID为{id}的记录时出错: {e}")
+        except Exception:
+            logger.exception("查询ID为%s的记录时出错", id)
             return None
 
     def get_by_code(
@@ -81,8 +85,8 @@ class BaseCRUDService(Generic[ModelType, CreateSchemaType, UpdateSchemaType], AB
 
             result = self.session.exec(statement).first()
             return result
-        except Exception as e:
-            print(f"查询编码为{code}的记录时出错: {e}")
+        except Exception:
+            logger.exception("查询编码为%s的记录时出错", code)
             return None
 
     def get_list(
@@ -130,8 +134,8 @@ class BaseCRUDService(Generic[ModelType, CreateSchemaType, UpdateSchemaType], AB
 
             return items, total
 
-        except Exception as e:
-            print(f"查询列表时出错: {e}")
+        except Exception:
+            logger.exception("查询列表时出错")
             return [], 0
 
     def create(self, obj_in: CreateSchemaType) -> ModelType:
@@ -175,6 +179,7 @@ class BaseCRUDService(Generic[ModelType, CreateSchemaType, UpdateSchemaType], AB
             db_obj = self.model(**obj_data)
             self.session.add(db_obj)
             self.session.commit()
+            self._clear_options_cache()
             self.session.refresh(db_obj)
 
             return db_obj
@@ -184,7 +189,7 @@ class BaseCRUDService(Generic[ModelType, CreateSchemaType, UpdateSchemaType], AB
             raise
         except Exception as e:
             self.session.rollback()
-            print(f"创建记录时出错: {e}")
+            logger.exception("创建记录时出错")
             raise Exception(f"创建失败: {str(e)}")
 
     def update(self, id: int, obj_in: UpdateSchemaType) -> Optional[ModelType]:
@@ -251,7 +256,13 @@ class BaseCRUDService(Generic[ModelType, CreateSchemaType, UpdateSchemaType], AB
             if hasattr(db_obj, "updated_at"):
                 db_obj.updated_at = datetime.utcnow()
 
+            # 同步paths表中的冗余编码和名称
+            if hasattr(self.model, "code") and hasattr(self.model, "name"):
+                cascade_service = get_path_cascade_service(self.session)
+                cascade_service.sync_related_fields(self.model.__tablename__, db_obj)
+
             self.session.commit()
+            self._clear_options_cache()
             self.session.refresh(db_obj)
 
             return db_obj
@@ -261,7 +272,7 @@ class BaseCRUDService(Generic[ModelType, CreateSchemaType, UpdateSchemaType], AB
             raise
         except Exception as e:
             self.session.rollback()
-            print(f"更新记录时出错: {e}")
+            logger.exception("更新记录时出错")
             raise Exception(f"更新失败: {str(e)}")
 
     def delete(self, id: int, cascade: bool = True) -> bool:
@@ -295,6 +306,7 @@ class BaseCRUDService(Generic[ModelType, CreateSchemaType, UpdateSchemaType], AB
                 self.session.delete(db_obj)
                 self.session.commit()
 
+            self._clear_options_cache()
             return True
 
         except NotFoundException:
@@ -302,7 +314,7 @@ class BaseCRUDService(Generic[ModelType, CreateSchemaType, UpdateSchemaType], AB
             raise
         except Exception as e:
             self.session.rollback()
-            print(f"删除记录时出错: {e}")
+            logger.exception("删除记录时出错")
             raise Exception(f"删除失败: {str(e)}")
 
     def _build_filter_conditions(self, filters: Dict[str, Any]) -> List[Any]:
@@ -371,6 +383,14 @@ class BaseCRUDService(Generic[ModelType, CreateSchemaType, UpdateSchemaType], AB
             and self.model.__tablename__ in cascade_tables
         )
 
+    def _clear_options_cache(self) -> None:
+        """
+        基础表或路径数据变更后清空选项缓存
+        """
+        if self._should_cascade_delete() or self.model.__tablename__ == "paths":
+            options_cache.clear()
+            cascade_options_cache.clear()
+
     def _perform_cascade_delete(self, record_id: int) -> None:
         """
         执行级联删除
@@ -387,13 +407,15 @@ class BaseCRUDService(Generic[ModelType, CreateSchemaType, UpdateSchemaType], AB
             )
 
             if affected_rows > 0:
-                print(
-                    f"级联删除完成: 表 {table_name} ID {record_id}, 影响 {affected_rows} 条路径"
+                logger.info(
+                    "级联删除完成: 表 %s ID %s, 影响 %s 条路径",
+                    table_name,
+                    record_id,
+                    affected_rows,
                 )
 
-        except Exception as e:
-            print(f"级联删除时出错: {e}")
-            pass
+        except Exception:
+            logger.exception("级联删除时出错")
 
     def delete_all(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """
@@ -430,12 +452,13 @@ class BaseCRUDService(Generic[ModelType, CreateSchemaType, UpdateSchemaType], AB
             affected_rows = result.rowcount
 
             self.session.commit()
+            self._clear_options_cache()
 
             return affected_rows
 
         except Exception as e:
             self.session.rollback()
-            print(f"批量删除记录时出错: {e}")
+            logger.exception("批量删除记录时出错")
             raise Exception(f"批量删除失败: {str(e)}")
 
 
@@ -6,6 +6,7 @@ from models import BridgeScales
 from models.enums import ScalesType
 from schemas.bridge_scales import BridgeScalesCreate, BridgeScalesUpdate
 from services.base_crud import BaseCRUDService, PageParams
+from services.path_cascade import get_path_cascade_service
 from exceptions import NotFoundException, DuplicateException
 
 
@@ -116,6 +117,7 @@ class BridgeScalesService(
             db_obj = BridgeScales(**obj_data)
             self.session.add(db_obj)
             self.session.commit()
+            self._clear_options_cache()
             self.session.refresh(db_obj)
 
             return db_obj
@@ -189,7 +191,12 @@ class BridgeScalesService(
 
             db_obj.updated_at = datetime.now(timezone.utc)
 
+            # 同步paths表中的冗余标度信息
+            cascade_service = get_path_cascade_service(self.session)
+            cascade_service.sync_related_fields("bridge_scales", db_obj)
+
             self.session.commit()
+            self._clear_options_cache()
             self.session.refresh(db_obj)
 
             return db_obj
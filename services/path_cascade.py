@@ -1,8 +1,11 @@
 from sqlmodel import Session, and_, update
 from datetime import datetime
+import logging
 
 from models.paths import Paths
 
+logger = logging.getLogger(__name__)
+
 
 class PathCascadeService:
     """路径级联删除服务"""
@@ -40,6 +43,38 @@ class PathCascadeService:
 
         return self._cascade_delete_by_field(field_name, record_id)
 
+    def sync_related_fields(self, table_name: str, record) -> int:
+        """
+        基础表记录更新后，同步paths表中冗余的编码和名称
+        不提交事务，由调用方统一提交
+
+        Args:
+            table_name: 基础表名
+            record: 更新后的基础表记录
+        """
+        field_name = self.table_field_mapping.get(table_name)
+        if not field_name:
+            return 0
+
+        prefix = field_name[: -len("_id")]
+        values = {
+            f"{prefix}_code": record.code,
+            f"{prefix}_name": record.name,
+        }
+        if table_name == "bridge_scales":
+            # services.paths 经 base_crud 导入本模块，在此处导入避免循环导入
+            from services.paths import SCALE_DETAIL_FIELDS
+
+            for scale_field in SCALE_DETAIL_FIELDS:
+                values[scale_field] = getattr(record, scale_field)
+
+        stmt = (
+            update(Paths)
+            .where(getattr(Paths, field_name) == record.id)
+            .values(**values)
+        )
+        return self.session.execute(stmt).rowcount
+
     def _cascade_delete_by_field(self, field_name: str, field_value: int) -> int:
         """
         根据字段名和值级联删除
@@ -68,14 +103,14 @@ class PathCascadeService:
             # 提交事务
             self.session.commit()
 
-            print(
-                f"级联删除: {field_name}={field_value}, 影响 {affected_rows} 条路径记录"
+            logger.info(
+                "级联删除: %s=%s, 影响 %s 条路径记录", field_name, field_value, affected_rows
             )
             return affected_rows
 
-        except Exception as e:
+        except Exception:
             self.session.rollback()
-            print(f"级联删除失败: {e}")
+            logger.exception("级联删除失败")
             raise
         
 def get_path_cascade_service(session: Session) -> PathCascadeService:
@@ -1,11 +1,14 @@
-from typing import List, Optional, Dict, Any, Tuple
-from sqlmodel import Session, select, and_
-from sqlalchemy import func
+from typing import Iterator, List, Optional, Dict, Any, Set, Tuple
+from sqlmodel import Session, select, and_, or_
+from sqlalchemy import func, insert, literal, null, union_all
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from pydantic import ValidationError as PydanticValidationError
 from datetime import datetime, timezone
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.utils import get_column_letter
 from io import BytesIO
-from openpyxl.styles import Font, PatternFill
-import traceback
+import logging
 
 
 from models.paths import Paths
@@ -24,15 +27,160 @@ from models import (
     BridgeQualities,
     BridgeQuantities,
 )
-from exceptions import DuplicateException, NotFoundException, ValidationException
+from config.settings import settings
+from exceptions import (
+    DatabaseException,
+    DuplicateException,
+    NotFoundException,
+    SystemException,
+    ValidationException,
+)
 from utils import (
+    HEADER_FONT,
+    HEADER_FILL,
+    INSTRUCTION_FONT,
+    build_reference_data_rows,
     create_reference_data_sheet,
     create_help_sheet,
     validate_excel_data,
     get_reference_data,
     match_name_to_code,
+    options_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+# Paths 是否支持软删除，模块加载时确定一次
+_PATHS_HAS_IS_ACTIVE = hasattr(Paths, "is_active")
+
+# 选项查询每批读取的行数
+OPTIONS_YIELD_PER = 1000
+
+# 冗余到 paths 表的标度详情字段
+SCALE_DETAIL_FIELDS = (
+    "scale_type",
+    "scale_value",
+    "min_value",
+    "max_value",
+    "unit",
+    "display_text",
+)
+
+# paths 字段与基础表、返回字段前缀的映射
+RELATED_FIELD_MAPPINGS = (
+    ("category_id", Categories, "category"),
+    ("assessment_unit_id", AssessmentUnit, "assessment_unit"),
+    ("bridge_type_id", BridgeTypes, "bridge_type"),
+    ("part_id", BridgeParts, "part"),
+    ("structure_id", BridgeStructures, "structure"),
+    ("component_type_id", BridgeComponentTypes, "component_type"),
+    ("component_form_id", BridgeComponentForms, "component_form"),
+    ("disease_id", BridgeDiseases, "disease"),
+    ("scale_id", BridgeScales, "scale"),
+    ("quality_id", BridgeQualities, "quality"),
+    ("quantity_id", BridgeQuantities, "quantity"),
 )
 
+# 编码字段与基础表、paths 字段的映射
+CODE_FIELD_MAPPINGS = (
+    ("category_code", Categories, "category_id"),
+    ("assessment_unit_code", AssessmentUnit, "assessment_unit_id"),
+    ("bridge_type_code", BridgeTypes, "bridge_type_id"),
+    ("part_code", BridgeParts, "part_id"),
+    ("structure_code", BridgeStructures, "structure_id"),
+    ("component_type_code", BridgeComponentTypes, "component_type_id"),
+    ("component_form_code", BridgeComponentForms, "component_form_id"),
+    ("disease_code", BridgeDiseases, "disease_id"),
+    ("scale_code", BridgeScales, "scale_id"),
+    ("quality_code", BridgeQualities, "quality_id"),
+    ("quantity_code", BridgeQuantities, "quantity_id"),
+)
+
+# 基础表名、模型、选项键与 paths 字段的映射
+REFERENCE_TABLE_CONFIGS = tuple(
+    (model_class.__tablename__, model_class, prefix, getattr(Paths, id_field))
+    for id_field, model_class, prefix in RELATED_FIELD_MAPPINGS
+)
+
+# 过滤条件编码字段与基础表、paths 字段的映射
+FILTER_CODE_MAPPINGS = tuple(
+    (code_field, model_class, getattr(Paths, id_field))
+    for code_field, model_class, id_field in CODE_FIELD_MAPPINGS
+)
+
+# 路径唯一性校验字段
+PATH_UNIQUENESS_FIELDS = tuple(id_field for _, _, id_field in CODE_FIELD_MAPPINGS)
+
+# 批量导入每个保存点提交的行数
+IMPORT_BATCH_SIZE = 1000
+
+# 批量插入时写入的列（主键由数据库生成）
+_PATHS_INSERT_COLUMNS = tuple(
+    column.name for column in Paths.__table__.columns if column.name != "id"
+)
+
+# 导入模板主工作表的表头
+TEMPLATE_HEADERS = (
+    "编码",
+    "名称",
+    "桥梁类别",
+    "评定单元",
+    "桥梁类型",
+    "部位",
+    "结构类型",
+    "部件类型",
+    "构件形式",
+    "病害类型",
+    "标度",
+    "定性描述",
+    "定量描述",
+)
+
+# 导入模板的填写说明
+TEMPLATE_INSTRUCTION = "说明：请在下方填写数据，必须与参考数据表中的名称完全一致，编码可留空由系统自动生成"
+
+# xlsx 文件（zip 格式）的文件头
+XLSX_MAGIC = b"PK\x03\x04"
+
+# 导出模板时每次读取的字节数
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# 与 PathsBase 中的字段长度限制保持一致
+PATH_CODE_MAX_LENGTH = 50
+PATH_NAME_MAX_LENGTH = 200
+
+# 各前缀关联字段的空值模板
+_SCALE_NULL_TEMPLATE = dict.fromkeys(("scale_code", "scale_name", *SCALE_DETAIL_FIELDS))
+_NULL_TEMPLATES = {
+    prefix: (
+        _SCALE_NULL_TEMPLATE
+        if model_class == BridgeScales
+        else dict.fromkeys((f"{prefix}_code", f"{prefix}_name"))
+    )
+    for _, model_class, prefix in RELATED_FIELD_MAPPINGS
+}
+
+# 全部关联字段为空的返回数据模板
+_EMPTY_RELATED_DATA = {
+    key: None
+    for field_name, _, prefix in RELATED_FIELD_MAPPINGS
+    for key in (field_name, *_NULL_TEMPLATES[prefix])
+}
+
+
+def _iter_bytes_chunks(
+    data: bytes, chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    分块返回文件内容
+
+    Args:
+        data: 文件内容
+        chunk_size: 每块字节数
+    """
+    for start in range(0, len(data), chunk_size):
+        yield data[start : start + chunk_size]
+
 
 # 需要自定义类，不能用工厂函数，只能继承
 class PathsService(BaseCRUDService[Paths, PathsCreate, PathsUpdate]):
@@ -52,27 +200,33 @@ class PathsService(BaseCRUDService[Paths, PathsCreate, PathsUpdate]):
             conditions: 查询条件
         """
         try:
-            # 基础查询
-            statement = select(Paths)
-            count_statement = select(func.count(Paths.id))
+            # 基础查询，总数通过窗口函数随分页结果一并返回
+            statement = select(Paths, func.count().over().label("total_count"))
 
             # 过滤条件
             filter_conditions = []
-            if hasattr(Paths, "is_active"):
+            if _PATHS_HAS_IS_ACTIVE:
                 filter_conditions.append(Paths.is_active == True)
             if conditions:
                 filter_conditions.extend(self._build_path_filter_conditions(conditions))
             if filter_conditions:
-                statement = statement.where(and_(*filter_conditions))
-                count_statement = count_statement.where(and_(*filter_conditions))
+                statement = statement.where(*filter_conditions)
 
             # 排序
             statement = statement.order_by(Paths.id)
 
             # 分页
             statement = statement.offset(page_params.offset).limit(page_params.size)
-            results = self.session.exec(statement).all()
-            total = self.session.exec(count_statement).first() or 0
+            rows = self.session.exec(statement).all()
+            results = [row[0] for row in rows]
+            if rows:
+                total = rows[0].total_count
+            elif page_params.offset:
+                # 页码超出范围时没有返回行，单独统计总数
+                count_statement = select(func.count(Paths.id)).where(*filter_conditions)
+                total = self.session.exec(count_statement).first() or 0
+            else:
+                total = 0
 
             # 转换为PathsResponse
             paths_list = []
@@ -85,118 +239,207 @@ class PathsService(BaseCRUDService[Paths, PathsCreate, PathsUpdate]):
 
                 # 添加各个ID对应的关联数据
                 path_data.update(self._get_related_data(result))
-                paths_list.append(PathsResponse(**path_data))
+                # 数据来自数据库，跳过校验直接构建
+                paths_list.append(PathsResponse.model_construct(**path_data))
 
             return paths_list, total
 
-        except Exception as e:
-            print(f"分页查询路径数据时出错: {e}")
+        except Exception:
+            logger.exception("分页查询路径数据时出错")
             return [], 0
 
+        finally:
+            # 结果已转换为响应模型，释放会话中的 ORM 对象
+            self.session.expunge_all()
+
     def _get_related_data(self, path_result) -> Dict[str, Any]:
         """
         获取path记录中各个ID对应的关联数据
         """
-        related_data = {}
-
-        # 定义字段映射关系
-        field_mappings = [
-            ("category_id", Categories, "category"),
-            ("assessment_unit_id", AssessmentUnit, "assessment_unit"),
-            ("bridge_type_id", BridgeTypes, "bridge_type"),
-            ("part_id", BridgeParts, "part"),
-            ("structure_id", BridgeStructures, "structure"),
-            ("component_type_id", BridgeComponentTypes, "component_type"),
-            ("component_form_id", BridgeComponentForms, "component_form"),
-            ("disease_id", BridgeDiseases, "disease"),
-            ("scale_id", BridgeScales, "scale"),
-            ("quality_id", BridgeQualities, "quality"),
-            ("quantity_id", BridgeQuantities, "quantity"),
-        ]
+        # 关联字段默认为空，只覆盖有值的字段
+        related_data = _EMPTY_RELATED_DATA.copy()
 
-        for field_name, model_class, prefix in field_mappings:
+        for field_name, model_class, prefix in RELATED_FIELD_MAPPINGS:
             field_id = getattr(path_result, field_name, None)
+            if not field_id:
+                continue
 
             # 返回各个字段对应的 id
             related_data[field_name] = field_id
-            if field_id:
-                try:
-                    # 标度表处理
-                    if model_class == BridgeScales:
-                        stmt = select(
-                            BridgeScales.code,
-                            BridgeScales.name,
-                            BridgeScales.scale_type,
-                            BridgeScales.scale_value,
-                            BridgeScales.min_value,
-                            BridgeScales.max_value,
-                            BridgeScales.unit,
-                            BridgeScales.display_text,
-                        ).where(BridgeScales.id == field_id)
-                        result = self.session.exec(stmt).first()
-                        if result:
-                            related_data[f"{prefix}_code"] = result[0]
-                            related_data[f"{prefix}_name"] = result[1]
-                            related_data["scale_type"] = result[2]
-                            related_data["scale_value"] = result[3]
-                            related_data["min_value"] = result[4]
-                            related_data["max_value"] = result[5]
-                            related_data["unit"] = result[6]
-                            related_data["display_text"] = result[7]
-                        else:
-                            related_data[f"{prefix}_code"] = None
-                            related_data[f"{prefix}_name"] = None
-                            related_data["scale_type"] = None
-                            related_data["scale_value"] = None
-                            related_data["min_value"] = None
-                            related_data["max_value"] = None
-                            related_data["unit"] = None
-                            related_data["display_text"] = None
-                    else:
-                        # 其他表的处理
-                        stmt = select(model_class.code, model_class.name).where(
-                            model_class.id == field_id
-                        )
-                        result = self.session.exec(stmt).first()
-                        if result:
-                            related_data[f"{prefix}_code"] = result[0]
-                            related_data[f"{prefix}_name"] = result[1]
-                        else:
-                            related_data[f"{prefix}_code"] = None
-                            related_data[f"{prefix}_name"] = None
-                except Exception as e:
-                    print(
-                        f"查询模型 {model_class.__name__} 中ID为 {field_id} 的记录时出错: {e}"
-                    )
-                    if model_class == BridgeScales:
-                        related_data[f"{prefix}_code"] = None
-                        related_data[f"{prefix}_name"] = None
-                        related_data["scale_type"] = None
-                        related_data["scale_value"] = None
-                        related_data["min_value"] = None
-                        related_data["max_value"] = None
-                        related_data["unit"] = None
-                        related_data["display_text"] = None
-                    else:
-                        related_data[f"{prefix}_code"] = None
-                        related_data[f"{prefix}_name"] = None
-            else:
-                # 字段为空时的处理
-                if model_class == BridgeScales:
-                    related_data[f"{prefix}_code"] = None
-                    related_data[f"{prefix}_name"] = None
-                    related_data["scale_type"] = None
-                    related_data["scale_value"] = None
-                    related_data["min_value"] = None
-                    related_data["max_value"] = None
-                    related_data["unit"] = None
-                    related_data["display_text"] = None
-                else:
-                    related_data[f"{prefix}_code"] = None
-                    related_data[f"{prefix}_name"] = None
+
+            # 优先读取 paths 表上的冗余字段
+            if getattr(path_result, f"{prefix}_code", None) is not None:
+                for key in _NULL_TEMPLATES[prefix]:
+                    related_data[key] = getattr(path_result, key)
+                continue
+
+            # 冗余字段未回填时读取基础表缓存
+            try:
+                lookup = self._get_reference_lookup()[model_class.__tablename__]
+                result = lookup["by_id"].get(field_id)
+                if result:
+                    related_data.update(zip(_NULL_TEMPLATES[prefix], result))
+            except Exception:
+                logger.exception(
+                    "查询模型 %s 中ID为 %s 的记录时出错", model_class.__name__, field_id
+                )
 
         return related_data
 
+    @staticmethod
+    def _related_columns(model_class) -> List[Any]:
+        """
+        基础表需要读取的列：id、编码、名称（标度附带标度详情）
+
+        Args:
+            model_class: 基础表模型
+        """
+        columns = [model_class.id, model_class.code, model_class.name]
+        if model_class == BridgeScales:
+            columns.extend(getattr(BridgeScales, field) for field in SCALE_DETAIL_FIELDS)
+        return columns
+
+    def _get_reference_lookup(self) -> Dict[str, Dict[str, Dict[Any, Any]]]:
+        """
+        获取各基础表 编码->id 与 id->关联字段值 的映射，与选项共用缓存
+
+        Returns:
+            表名 -> {"by_code": 编码->id, "by_id": id->(编码, 名称, ...)}
+        """
+        cached = options_cache.get("reference_lookup")
+        if cached is not None:
+            return cached
+
+        lookup = {}
+        for _, model_class, _ in RELATED_FIELD_MAPPINGS:
+            by_code, by_id = {}, {}
+            for row in self.session.exec(select(*self._related_columns(model_class))):
+                by_code[row[1]] = row[0]
+                by_id[row[0]] = tuple(row[1:])
+            lookup[model_class.__tablename__] = {"by_code": by_code, "by_id": by_id}
+
+        options_cache.set("reference_lookup", lookup)
+        return lookup
+
+    def _resolve_reference_codes(
+        self, codes: Dict[str, Optional[str]]
+    ) -> Dict[str, Any]:
+        """
+        用一条 UNION ALL 查询解析各基础表编码
+
+        Args:
+            codes: code 字段名到编码的映射，空编码会被忽略
+
+        Returns:
+            paths 的关联 id 及冗余的编码、名称（标度附带标度详情）
+        """
+        # 标度查询放在首位，使合并结果沿用标度详情字段的类型
+        mappings = sorted(CODE_FIELD_MAPPINGS, key=lambda m: m[1] != BridgeScales)
+
+        selects = []
+        for code_field, model_class, _ in mappings:
+            code_value = codes.get(code_field)
+            if not code_value:
+                continue
+            if model_class == BridgeScales:
+                details = [getattr(BridgeScales, field) for field in SCALE_DETAIL_FIELDS]
+            else:
+                details = [null().label(field) for field in SCALE_DETAIL_FIELDS]
+            selects.append(
+                select(
+                    literal(code_field).label("code_field"),
+                    model_class.id,
+                    model_class.code,
+                    model_class.name,
+                    *details,
+                ).where(
+                    model_class.code == code_value,
+                    model_class.is_active == True,
+                )
+            )
+
+        if not selects:
+            return {}
+
+        stmt = union_all(*selects) if len(selects) > 1 else selects[0]
+        rows = {}
+        for row in self.session.execute(stmt):
+            rows.setdefault(row.code_field, row)
+
+        # 汇总所有找不到的编码后统一报错
+        missing = [
+            f"{code_field} 为 '{codes[code_field]}'"
+            for code_field, _, _ in CODE_FIELD_MAPPINGS
+            if codes.get(code_field) and code_field not in rows
+        ]
+        if missing:
+            raise ValidationException(f"找不到 {'、'.join(missing)} 的记录")
+
+        resolved = {}
+        for code_field, model_class, id_field in CODE_FIELD_MAPPINGS:
+            row = rows.get(code_field)
+            if row is None:
+                continue
+            resolved[id_field] = row.id
+            resolved.update(
+                self._build_related_fields(model_class, id_field[: -len("_id")], row)
+            )
+        return resolved
+
+    def _resolve_reference_code_sets(
+        self, codes_by_field: Dict[str, Set[Optional[str]]]
+    ) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        按基础表批量解析编码，每个表只执行一次 IN 查询
+
+        Args:
+            codes_by_field: code 字段名到编码集合的映射，空编码会被忽略
+
+        Returns:
+            (code 字段名, 编码) 到 paths 关联 id 及冗余字段的映射，找不到的编码不在结果中
+        """
+        resolved = {}
+        for code_field, model_class, id_field in CODE_FIELD_MAPPINGS:
+            codes = {code for code in codes_by_field.get(code_field, ()) if code}
+            if not codes:
+                continue
+
+            stmt = select(*self._related_columns(model_class)).where(
+                model_class.code.in_(codes),
+                model_class.is_active == True,
+            )
+
+            prefix = id_field[: -len("_id")]
+            for row in self.session.exec(stmt):
+                key = (code_field, row.code)
+                if key in resolved:
+                    continue
+                resolved[key] = {
+                    id_field: row.id,
+                    **self._build_related_fields(model_class, prefix, row),
+                }
+        return resolved
+
+    def _build_related_fields(
+        self, model_class, prefix: str, row: Optional[Any]
+    ) -> Dict[str, Any]:
+        """
+        构建写入 paths 表的冗余字段
+
+        Args:
+            model_class: 基础表模型
+            prefix: 字段前缀
+            row: 基础表记录，为空时冗余字段全部置空
+        """
+        related_fields = {
+            f"{prefix}_code": row.code if row else None,
+            f"{prefix}_name": row.name if row else None,
+        }
+        if model_class == BridgeScales:
+            for field in SCALE_DETAIL_FIELDS:
+                related_fields[field] = getattr(row, field) if row else None
+        return related_fields
+
     def get_filter_options(self) -> Dict[str, List[Dict[str, Any]]]:
         """
         获取Paths 表中存在的所有相关表的关联数据
@@ -204,132 +447,95 @@ class PathsService(BaseCRUDService[Paths, PathsCreate, PathsUpdate]):
         Returns:
             包含各表选项的字典
         """
+        cached = options_cache.get("filter_options")
+        if cached is not None:
+            return cached
+
         try:
             options = {}
 
-            # 定义字段映射
-            table_configs = [
-                ("categories", Categories, "category", Paths.category_id),
-                (
-                    "assessment_units",
-                    AssessmentUnit,
-                    "assessment_unit",
-                    Paths.assessment_unit_id,
-                ),
-                ("bridge_types", BridgeTypes, "bridge_type", Paths.bridge_type_id),
-                ("bridge_parts", BridgeParts, "part", Paths.part_id),
-                (
-                    "bridge_structures",
-                    BridgeStructures,
-                    "structure",
-                    Paths.structure_id,
-                ),
-                (
-                    "bridge_component_types",
-                    BridgeComponentTypes,
-                    "component_type",
-                    Paths.component_type_id,
-                ),
-                (
-                    "bridge_component_forms",
-                    BridgeComponentForms,
-                    "component_form",
-                    Paths.component_form_id,
-                ),
-                ("bridge_diseases", BridgeDiseases, "disease", Paths.disease_id),
-                ("bridge_scales", BridgeScales, "scale", Paths.scale_id),
-                ("bridge_qualities", BridgeQualities, "quality", Paths.quality_id),
-                ("bridge_quantities", BridgeQuantities, "quantity", Paths.quantity_id),
-            ]
-
-            for table_name, model_class, option_key, path_field in table_configs:
+            for (
+                table_name,
+                model_class,
+                option_key,
+                path_field,
+            ) in REFERENCE_TABLE_CONFIGS:
                 try:
-                    # 查询在paths表中存在的ID
-                    existing_ids_stmt = (
-                        select(path_field).where(path_field.is_not(None)).distinct()
-                    )
-                    existing_ids = self.session.exec(existing_ids_stmt).all()
-
-                    if existing_ids:
-                        # 标度表处理
-                        if model_class == BridgeScales:
-                            # 查询标度表的完整信息
-                            stmt = (
-                                select(
-                                    BridgeScales.code,
-                                    BridgeScales.scale_type,
-                                    BridgeScales.scale_value,
-                                    BridgeScales.min_value,
-                                    BridgeScales.max_value,
-                                    BridgeScales.unit,
-                                    BridgeScales.display_text,
-                                )
-                                .where(
-                                    and_(
-                                        BridgeScales.id.in_(existing_ids),
-                                        BridgeScales.is_active == True,
-                                    )
-                                )
-                                .order_by(BridgeScales.code)
-                            )
+                    # paths表中存在的ID作为子查询，与基础表查询合并为一次往返
+                    existing_ids = select(path_field).where(path_field.is_not(None))
 
-                            results = self.session.exec(stmt).all()
-                            scale_options = []
-
-                            for row in results:
-                                (
-                                    code,
-                                    scale_type,
-                                    scale_value,
-                                    min_value,
-                                    max_value,
-                                    unit,
-                                    display_text,
-                                ) = row
-
-                                # 根据标度类型构建不同的name
-                                if scale_type == "NUMERIC":
-                                    display_name = str(scale_value)
-                                elif scale_type == "RANGE":
-                                    display_name = f"{min_value}-{max_value}{unit}"
-                                elif scale_type == "TEXT":
-                                    display_name = display_text
-                                else:
-                                    display_name = None
-
-                                scale_options.append(
-                                    {"code": code, "name": display_name}
-                                )
-
-                            options[option_key] = scale_options
-                        else:
-                            # 其他表的处理
-                            stmt = (
-                                select(model_class.code, model_class.name)
-                                .where(
-                                    and_(
-                                        model_class.id.in_(existing_ids),
-                                        model_class.is_active == True,
-                                    )
-                                )
-                                .order_by(model_class.code)
+                    # 标度表处理
+                    if model_class == BridgeScales:
+                        # 查询标度表的完整信息
+                        stmt = (
+                            select(
+                                BridgeScales.code,
+                                BridgeScales.scale_type,
+                                BridgeScales.scale_value,
+                                BridgeScales.min_value,
+                                BridgeScales.max_value,
+                                BridgeScales.unit,
+                                BridgeScales.display_text,
+                            )
+                            .where(
+                                BridgeScales.id.in_(existing_ids),
+                                BridgeScales.is_active == True,
                             )
+                            .order_by(BridgeScales.code)
+                        )
 
-                            result = self.session.exec(stmt).all()
-                            options[option_key] = [
-                                {"code": row[0], "name": row[1]} for row in result
-                            ]
+                        results = self.session.exec(stmt).all()
+                        scale_options = []
+
+                        for row in results:
+                            (
+                                code,
+                                scale_type,
+                                scale_value,
+                                min_value,
+                                max_value,
+                                unit,
+                                display_text,
+                            ) = row
+
+                            # 根据标度类型构建不同的name
+                            if scale_type == "NUMERIC":
+                                display_name = str(scale_value)
+                            elif scale_type == "RANGE":
+                                display_name = f"{min_value}-{max_value}{unit}"
+                            elif scale_type == "TEXT":
+                                display_name = display_text
+                            else:
+                                display_name = None
+
+                            scale_options.append({"code": code, "name": display_name})
+
+                        options[option_key] = scale_options
                     else:
-                        options[option_key] = []
+                        # 其他表的处理
+                        stmt = (
+                            select(model_class.code, model_class.name)
+                            .where(
+                                model_class.id.in_(existing_ids),
+                                model_class.is_active == True,
+                            )
+                            .order_by(model_class.code)
+                        )
+
+                        result = self.session.exec(stmt).all()
+                        options[option_key] = [
+                            {"code": row[0], "name": row[1]} for row in result
+                        ]
 
-                except Exception as e:
-                    print(f"查询表 {table_name} 选项时出错: {e}")
+                except Exception:
+                    logger.exception("查询表 %s 选项时出错", table_name)
                     options[option_key] = []
 
+            options_cache.set("filter_options", options)
             return options
 
-        except Exception as e:
-            print(f"获取过滤选项时出错: {e}")
+        except Exception:
+            logger.exception("获取过滤选项时出错")
             return {}
 
     def _build_path_filter_conditions(self, conditions: PathConditions) -> List[Any]:
@@ -343,40 +549,25 @@ class PathsService(BaseCRUDService[Paths, PathsCreate, PathsUpdate]):
 
         try:
             # 按code过滤
-            code_mappings = [
-                # 前端传入category_code，对应基础表模型Categories，对比 Paths 表的 category_id 字段
-                ("category_code", Categories, Paths.category_id),
-                ("assessment_unit_code", AssessmentUnit, Paths.assessment_unit_id),
-                ("bridge_type_code", BridgeTypes, Paths.bridge_type_id),
-                ("part_code", BridgeParts, Paths.part_id),
-                ("structure_code", BridgeStructures, Paths.structure_id),
-                ("component_type_code", BridgeComponentTypes, Paths.component_type_id),
-                ("component_form_code", BridgeComponentForms, Paths.component_form_id),
-                ("disease_code", BridgeDiseases, Paths.disease_id),
-                ("scale_code", BridgeScales, Paths.scale_id),
-                ("quality_code", BridgeQualities, Paths.quality_id),
-                ("quantity_code", BridgeQuantities, Paths.quantity_id),
-            ]
-
-            for condition_field, model_class, path_field in code_mappings:
+            for condition_field, model_class, path_field in FILTER_CODE_MAPPINGS:
                 # 获取前端传入的code值
                 code_value = getattr(conditions, condition_field, None)
                 if code_value:
                     try:
-                        # 找到对应的ID
-                        stmt = select(model_class.id).where(
-                            model_class.code == code_value
-                        )
-                        result = self.session.exec(stmt).first()
+                        # 从基础表缓存中找到对应的ID
+                        lookup = self._get_reference_lookup()[model_class.__tablename__]
+                        result = lookup["by_code"].get(code_value)
                         if result:
                             filter_conditions.append(path_field == result)
-                    except Exception as e:
-                        print(
-                            f"查询 {model_class.__name__} 中code为 {code_value} 的记录时出错: {e}"
+                    except Exception:
+                        logger.exception(
+                            "查询 %s 中code为 %s 的记录时出错",
+                            model_class.__name__,
+                            code_value,
                         )
 
-        except Exception as e:
-            print(f"构建路径过滤条件时出错: {e}")
+        except Exception:
+            logger.exception("构建路径过滤条件时出错")
 
         return filter_conditions
 
@@ -387,24 +578,13 @@ class PathsService(BaseCRUDService[Paths, PathsCreate, PathsUpdate]):
         Returns:
             包含各表选项的字典
         """
-        all_options = {}
+        cached = options_cache.get("options")
+        if cached is not None:
+            return cached
 
-        # 定义基础表的映射关系
-        table_configs = [
-            ("categories", Categories, "category"),
-            ("assessment_units", AssessmentUnit, "assessment_unit"),
-            ("bridge_types", BridgeTypes, "bridge_type"),
-            ("bridge_parts", BridgeParts, "part"),
-            ("bridge_structures", BridgeStructures, "structure"),
-            ("bridge_component_types", BridgeComponentTypes, "component_type"),
-            ("bridge_component_forms", BridgeComponentForms, "component_form"),
-            ("bridge_diseases", BridgeDiseases, "disease"),
-            ("bridge_scales", BridgeScales, "scale"),
-            ("bridge_qualities", BridgeQualities, "quality"),
-            ("bridge_quantities", BridgeQuantities, "quantity"),
-        ]
+        all_options = {}
 
-        for option_key, model_class, _ in table_configs:
+        for option_key, model_class, _, _ in REFERENCE_TABLE_CONFIGS:
             try:
                 # 对标度表进行特殊处理
                 if model_class == BridgeScales:
@@ -421,11 +601,12 @@ class PathsService(BaseCRUDService[Paths, PathsCreate, PathsUpdate]):
                         )
                         .where(BridgeScales.is_active == True)
                         .order_by(BridgeScales.code)
+                        .execution_options(yield_per=OPTIONS_YIELD_PER)
                     )
-                    results = self.session.exec(stmt).all()
                     scale_options = []
 
-                    for row in results:
+                    # 分批读取，避免一次性加载整张表
+                    for row in self.session.exec(stmt):
                         (
                             id_val,
                             code,
@@ -458,24 +639,49 @@ class PathsService(BaseCRUDService[Paths, PathsCreate, PathsUpdate]):
                         select(model_class.id, model_class.code, model_class.name)
                         .where(model_class.is_active == True)
                         .order_by(model_class.code)
+                        .execution_options(yield_per=OPTIONS_YIELD_PER)
                     )
-                    results = self.session.exec(stmt).all()
                     all_options[option_key] = [
                         {"id": row[0], "code": row[1], "name": row[2]}
-                        for row in results
+                        for row in self.session.exec(stmt)
                     ]
-            except Exception as e:
-                print(f"查询表 {option_key} 选项时出错: {e}")
+            except Exception:
+                logger.exception("查询表 %s 选项时出错", option_key)
                 all_options[option_key] = []
 
+        options_cache.set("options", all_options)
         return all_options
 
+    def _get_reference_data(self) -> Dict[str, Dict[str, str]]:
+        """
+        获取名称到编码的参考数据，与选项共用缓存
+        """
+        cached = options_cache.get("reference_data")
+        if cached is not None:
+            return cached
+
+        reference_data = get_reference_data(self.get_options())
+        options_cache.set("reference_data", reference_data)
+        return reference_data
+
+    def _get_reference_rows(self) -> List[List[Any]]:
+        """
+        获取模板参考数据表的行，与选项共用缓存
+        """
+        cached = options_cache.get("reference_rows")
+        if cached is not None:
+            return cached
+
+        rows = build_reference_data_rows(self.get_options())
+        options_cache.set("reference_rows", rows)
+        return rows
+
     def get_by_id_with_details(self, id: int) -> Optional[PathsResponse]:
         """根据 id 获取paths单条记录数据"""
         try:
             # 构建查询语句
             stmt = select(Paths).where(Paths.id == id)
-            if hasattr(Paths, "is_active"):
+            if _PATHS_HAS_IS_ACTIVE:
                 stmt = stmt.where(Paths.is_active == True)
 
             result = self.session.exec(stmt).first()
@@ -493,12 +699,15 @@ class PathsService(BaseCRUDService[Paths, PathsCreate, PathsUpdate]):
             # 添加各个ID对应的关联数据
             path_data.update(self._get_related_data(result))
 
-            return PathsResponse(**path_data)
+            return PathsResponse.model_construct(**path_data)
 
-        except Exception as e:
-            print(f"获取paths单条记录数据时出错: {e}")
+        except Exception:
+            logger.exception("获取paths单条记录数据时出错")
             return None
 
+        finally:
+            self.session.expunge_all()
+
     def create(self, obj_in: PathsCreate) -> Optional[PathsResponse]:
         """
         创建paths记录
@@ -512,114 +721,264 @@ class PathsService(BaseCRUDService[Paths, PathsCreate, PathsUpdate]):
                 "paths", obj_in.code
             )
 
-            if obj_in.name:
-                stmt = select(Paths).where(Paths.name == obj_in.name)
-                if hasattr(Paths, "is_active"):
-                    stmt = stmt.where(Paths.is_active == True)
-                existing_name = self.session.exec(stmt).first()
-                if existing_name:
-                    raise DuplicateException(
-                        resource="Paths", field="name", value=obj_in.name
-                    )
-
             # 通过各种 code 找到对应的 ID
             path_data = {
                 "code": final_code,
                 "name": obj_in.name,
             }
 
-            # code 到 ID 的映射关系
-            code_to_id_mappings = [
-                ("category_code", Categories, "category_id"),
-                ("assessment_unit_code", AssessmentUnit, "assessment_unit_id"),
-                ("bridge_type_code", BridgeTypes, "bridge_type_id"),
-                ("part_code", BridgeParts, "part_id"),
-                ("structure_code", BridgeStructures, "structure_id"),
-                ("component_type_code", BridgeComponentTypes, "component_type_id"),
-                ("component_form_code", BridgeComponentForms, "component_form_id"),
-                ("disease_code", BridgeDiseases, "disease_id"),
-                ("scale_code", BridgeScales, "scale_id"),
-                ("quality_code", BridgeQualities, "quality_id"),
-                ("quantity_code", BridgeQuantities, "quantity_id"),
-            ]
-
-            for code_field, model_class, id_field in code_to_id_mappings:
-                code_value = getattr(obj_in, code_field, None)
-                if code_value:
-                    # 查找对应的 ID
-                    stmt = select(model_class.id).where(
-                        and_(
-                            model_class.code == code_value,
-                            model_class.is_active == True,
-                        )
-                    )
-                    result = self.session.exec(stmt).first()
-                    if result:
-                        path_data[id_field] = result
-                    else:
-                        raise ValidationException(
-                            f"找不到 {code_field} 为 '{code_value}' 的记录"
-                        )
+            # 一次查询解析全部编码，同时记录冗余的编码和名称
+            codes = {
+                code_field: getattr(obj_in, code_field, None)
+                for code_field, _, _ in CODE_FIELD_MAPPINGS
+            }
+            path_data.update(self._resolve_reference_codes(codes))
 
-            # 检查记录的唯一性
-            path_uniqueness_fields = [
-                "category_id",
-                "assessment_unit_id",
-                "bridge_type_id",
-                "part_id",
-                "structure_id",
-                "component_type_id",
-                "component_form_id",
-                "disease_id",
-                "scale_id",
-                "quality_id",
-                "quantity_id",
-            ]
-
-            # 构建唯一性检查条件
+            # 检查记录的唯一性，构建唯一性检查条件
             uniqueness_conditions = []
-            for field in path_uniqueness_fields:
+            for field in PATH_UNIQUENESS_FIELDS:
                 field_value = path_data.get(field)
                 if field_value is not None:
                     uniqueness_conditions.append(getattr(Paths, field) == field_value)
                 else:
                     uniqueness_conditions.append(getattr(Paths, field).is_(None))
 
-            # 检查是否存在完全相同的路径记录
-            if uniqueness_conditions:
-                stmt = select(Paths).where(and_(*uniqueness_conditions))
-                if hasattr(Paths, "is_active"):
-                    stmt = stmt.where(Paths.is_active == True)
-                existing_path = self.session.exec(stmt).first()
-                if existing_path:
+            # 一次查询同时检查名称重复和完全相同的路径记录
+            duplicate_conditions = [and_(*uniqueness_conditions)]
+            if obj_in.name:
+                duplicate_conditions.append(Paths.name == obj_in.name)
+
+            stmt = select(Paths.id, Paths.name).where(or_(*duplicate_conditions))
+            if _PATHS_HAS_IS_ACTIVE:
+                stmt = stmt.where(Paths.is_active == True)
+            existing_path = self.session.exec(stmt).first()
+            if existing_path:
+                if obj_in.name and existing_path.name == obj_in.name:
                     raise DuplicateException(
-                        resource="Paths",
-                        field="path_combination",
-                        value="相同的路径组合已存在",
+                        resource="Paths", field="name", value=obj_in.name
                     )
+                raise DuplicateException(
+                    resource="Paths",
+                    field="path_combination",
+                    value="相同的路径组合已存在",
+                )
 
-            # 创建记录
+            # 创建记录，并发写入相同编码时由唯一索引拦截
             path_model = Paths(**path_data)
             self.session.add(path_model)
-            self.session.commit()
-            self.session.refresh(path_model)
+            try:
+                # flush 后即可取得自增主键
+                self.session.flush()
+
+                # 提交前构建返回数据，提交后对象过期，避免 refresh 再查询一次
+                response_data = {
+                    "id": path_model.id,
+                    "code": path_model.code,
+                    "name": path_model.name,
+                }
 
-            # 构建返回数据
-            response_data = {
-                "id": path_model.id,
-                "code": path_model.code,
-                "name": path_model.name,
-            }
+                # 添加各个ID对应的关联数据
+                response_data.update(self._get_related_data(path_model))
 
-            # 添加各个ID对应的关联数据
-            response_data.update(self._get_related_data(path_model))
+                self.session.commit()
+            except IntegrityError as e:
+                self.session.rollback()
+                # 回滚后编码已被占用，说明是并发写入了相同编码；其他完整性错误原样上报
+                if self.code_generator.code_exists("paths", final_code):
+                    raise DuplicateException(
+                        resource="Paths", field="code", value=final_code
+                    ) from e
+                raise DatabaseException(f"创建路径失败: {e.orig}", e) from e
+            options_cache.clear()
+            self.session.expunge(path_model)
 
-            return PathsResponse(**response_data)
+            return PathsResponse.model_construct(**response_data)
 
-        except Exception as e:
+        except (DuplicateException, ValidationException):
             self.session.rollback()
-            print(f"创建paths记录时出错: {e}")
             raise
+        except Exception:
+            self.session.rollback()
+            logger.exception("创建paths记录时出错")
+            raise
+
+    def _prepare_bulk_rows(
+        self, rows: List[PathsCreate], errors: Dict[int, str]
+    ) -> Tuple[List[Tuple[int, Dict[str, Any]]], Set[Tuple[Optional[int], ...]]]:
+        """
+        批量创建前的预检：解析编码、分配编码、检查名称和编码重复
+
+        Args:
+            rows: 创建路径参数列表
+            errors: 失败行下标到错误信息的映射，预检失败的行写入其中
+
+        Returns:
+            待写入的 (行下标, paths数据) 列表，以及已存在的路径组合
+        """
+        # 一次查询已存在的用户编码
+        user_codes = {row.code.strip() for row in rows if row.code and row.code.strip()}
+        taken_codes = set()
+        if user_codes:
+            taken_codes = set(
+                self.session.exec(select(Paths.code).where(Paths.code.in_(user_codes)))
+            )
+        # 自动生成的编码跳过已存在和本批用户填写的编码，多生成的部分用于补足被跳过的数量
+        blank_count = sum(1 for row in rows if not (row.code and row.code.strip()))
+        generated_codes = (
+            code
+            for code in self.code_generator.batch_generate_codes(
+                "paths", blank_count + len(user_codes)
+            )
+            if code not in user_codes and code not in taken_codes
+        )
+
+        # 一次查询已存在的名称
+        names = {row.name for row in rows if row.name}
+        taken_names = set()
+        if names:
+            stmt = select(Paths.name).where(Paths.name.in_(names))
+            if _PATHS_HAS_IS_ACTIVE:
+                stmt = stmt.where(Paths.is_active == True)
+            taken_names = set(self.session.exec(stmt))
+
+        # 每个基础表一次 IN 查询解析全部编码
+        resolved_codes = self._resolve_reference_code_sets(
+            {
+                code_field: {getattr(row, code_field, None) for row in rows}
+                for code_field, _, _ in CODE_FIELD_MAPPINGS
+            }
+        )
+
+        # 数据问题直接记录为行错误，不通过抛出异常传递
+        path_data_list: List[Tuple[int, Dict[str, Any]]] = []
+        for index, row in enumerate(rows):
+            path_data = {"name": row.name}
+            for code_field, _, _ in CODE_FIELD_MAPPINGS:
+                code_value = getattr(row, code_field, None)
+                if not code_value:
+                    continue
+                resolved = resolved_codes.get((code_field, code_value))
+                if resolved is None:
+                    errors[index] = f"找不到 {code_field} 为 '{code_value}' 的记录"
+                    break
+                path_data.update(resolved)
+            if index in errors:
+                continue
+
+            if row.name and row.name in taken_names:
+                errors[index] = f"名称 '{row.name}' 已存在"
+                continue
+
+            code_value = row.code.strip() if row.code else ""
+            if code_value:
+                if code_value in taken_codes:
+                    errors[index] = f"编码 '{code_value}' 已存在"
+                    continue
+                path_data["code"] = code_value
+                taken_codes.add(code_value)
+            else:
+                path_data["code"] = next(generated_codes)
+                taken_codes.add(path_data["code"])
+
+            if row.name:
+                taken_names.add(row.name)
+            path_data_list.append((index, path_data))
+
+        # 一次查询批次涉及类别下已存在的路径组合
+        taken_combinations = set()
+        category_ids = {data.get("category_id") for _, data in path_data_list}
+        if category_ids:
+            stmt = select(*(getattr(Paths, field) for field in PATH_UNIQUENESS_FIELDS))
+            stmt = stmt.where(Paths.category_id.in_(category_ids))
+            if _PATHS_HAS_IS_ACTIVE:
+                stmt = stmt.where(Paths.is_active == True)
+            taken_combinations = {tuple(row) for row in self.session.exec(stmt)}
+
+        return path_data_list, taken_combinations
+
+    def _bulk_create(
+        self, rows: List[PathsCreate], batch_size: int = IMPORT_BATCH_SIZE
+    ) -> Tuple[int, Dict[int, str]]:
+        """
+        批量创建paths记录，校验规则与 create 一致
+
+        Args:
+            rows: 创建路径参数列表
+            batch_size: 每个保存点写入的行数
+
+        Returns:
+            成功创建的数量，以及失败行下标到错误信息的映射
+        """
+        errors: Dict[int, str] = {}
+
+        # 预检查询期间会话中没有待写入的对象，关闭自动 flush
+        with self.session.no_autoflush:
+            path_data_list, taken_combinations = self._prepare_bulk_rows(rows, errors)
+
+        # 插入行模板：未提供的字段为空，默认值与 Paths 模型一致
+        now = datetime.utcnow()
+        row_template = {
+            **dict.fromkeys(_PATHS_INSERT_COLUMNS),
+            "is_active": True,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+        imported_count = 0
+        for start in range(0, len(path_data_list), batch_size):
+            batch = []
+            for index, path_data in path_data_list[start : start + batch_size]:
+                combination = tuple(path_data.get(f) for f in PATH_UNIQUENESS_FIELDS)
+                if combination in taken_combinations:
+                    errors[index] = "相同的路径组合已存在"
+                    continue
+                taken_combinations.add(combination)
+                batch.append((index, {**row_template, **path_data}))
+
+            if not batch:
+                continue
+
+            # 每批使用保存点，失败时只回滚当前批次；不回读主键，按 executemany 批量插入
+            try:
+                with self.session.begin_nested():
+                    self.session.execute(insert(Paths), [row for _, row in batch])
+                imported_count += len(batch)
+            except SQLAlchemyError:
+                # 批量写入失败时逐行重试，只让出错的行失败
+                imported_count += self._insert_rows_individually(batch, errors)
+
+        self.session.commit()
+        options_cache.clear()
+        self.session.expunge_all()
+
+        return imported_count, errors
+
+    def _insert_rows_individually(
+        self, batch: List[Tuple[int, Dict[str, Any]]], errors: Dict[int, str]
+    ) -> int:
+        """
+        逐行插入一批paths数据，每行使用独立保存点
+
+        Args:
+            batch: 待写入的 (行下标, paths数据) 列表
+            errors: 失败行下标到错误信息的映射，写入失败的行写入其中
+
+        Returns:
+            成功写入的行数
+        """
+        inserted_count = 0
+        for index, row in batch:
+            try:
+                with self.session.begin_nested():
+                    self.session.execute(insert(Paths), [row])
+                inserted_count += 1
+            except IntegrityError as e:
+                logger.warning("导入第 %s 行时数据冲突: %s", index, e.orig)
+                errors[index] = "编码、名称或路径组合与已有数据重复"
+            except SQLAlchemyError:
+                logger.exception("导入第 %s 行时写入失败", index)
+                errors[index] = "写入数据库失败"
+        return inserted_count
 
     def update(self, id: int, obj_in: PathsUpdate) -> Optional[PathsResponse]:
         """
@@ -635,9 +994,11 @@ class PathsService(BaseCRUDService[Paths, PathsCreate, PathsUpdate]):
             if not db_obj:
                 raise NotFoundException(resource="Paths", identifier=str(id))
 
-            obj_data = obj_in.model_dump(exclude_unset=True)
+            # 字段均为字符串，直接读取已设置的字段，不经过序列化
+            obj_data = {field: getattr(obj_in, field) for field in obj_in.model_fields_set}
 
             # 处理编码
+            duplicate_conditions = []
             if "code" in obj_data:
                 code_value = obj_data["code"]
                 if not code_value or not code_value.strip():
@@ -645,87 +1006,49 @@ class PathsService(BaseCRUDService[Paths, PathsCreate, PathsUpdate]):
                     obj_data.pop("code")
                 else:
                     code_value = code_value.strip()
-                    # 检查编码重复（排除当前记录）
-                    statement = select(Paths).where(
-                        and_(Paths.code == code_value, Paths.id != id)
-                    )
-                    if hasattr(Paths, "is_active"):
-                        statement = statement.where(Paths.is_active == True)
-                    existing = self.session.exec(statement).first()
-                    if existing:
-                        raise DuplicateException(
-                            resource="Paths", field="code", value=code_value
-                        )
                     obj_data["code"] = code_value
+                    duplicate_conditions.append(Paths.code == code_value)
 
-            # 检查名称重复（排除当前记录）
             if "name" in obj_data:
-                statement = select(Paths).where(
-                    and_(Paths.name == obj_data["name"], Paths.id != id)
+                duplicate_conditions.append(Paths.name == obj_data["name"])
+
+            # 一次查询同时检查编码和名称重复（排除当前记录）
+            if duplicate_conditions:
+                statement = select(Paths.code, Paths.name).where(
+                    or_(*duplicate_conditions), Paths.id != id
                 )
-                if hasattr(Paths, "is_active"):
+                if _PATHS_HAS_IS_ACTIVE:
                     statement = statement.where(Paths.is_active == True)
                 existing = self.session.exec(statement).first()
                 if existing:
+                    if "code" in obj_data and existing.code == obj_data["code"]:
+                        raise DuplicateException(
+                            resource="Paths", field="code", value=obj_data["code"]
+                        )
                     raise DuplicateException(
                         resource="Paths", field="name", value=obj_data["name"]
                     )
 
-            # code 到 id 的映射
-            code_to_id_mappings = [
-                ("category_code", Categories, "category_id"),
-                ("assessment_unit_code", AssessmentUnit, "assessment_unit_id"),
-                ("bridge_type_code", BridgeTypes, "bridge_type_id"),
-                ("part_code", BridgeParts, "part_id"),
-                ("structure_code", BridgeStructures, "structure_id"),
-                ("component_type_code", BridgeComponentTypes, "component_type_id"),
-                ("component_form_code", BridgeComponentForms, "component_form_id"),
-                ("disease_code", BridgeDiseases, "disease_id"),
-                ("scale_code", BridgeScales, "scale_id"),
-                ("quality_code", BridgeQualities, "quality_id"),
-                ("quantity_code", BridgeQuantities, "quantity_id"),
-            ]
-
-            for code_field, model_class, id_field in code_to_id_mappings:
+            # 一次查询解析全部编码，同时更新冗余的编码和名称
+            codes = {}
+            for code_field, model_class, id_field in CODE_FIELD_MAPPINGS:
                 if code_field in obj_data:
                     code_value = obj_data.pop(code_field)  # 移除code字段
                     if code_value:
-                        # 查找对应的 ID
-                        stmt = select(model_class.id).where(
-                            and_(
-                                model_class.code == code_value,
-                                model_class.is_active == True,
-                            )
-                        )
-                        result = self.session.exec(stmt).first()
-                        if result:
-                            obj_data[id_field] = result
-                        else:
-                            raise ValidationException(
-                                f"找不到 {code_field} 为 '{code_value}' 的记录"
-                            )
+                        codes[code_field] = code_value
                     else:
-                        # 如果code为空，将对应的ID设为None
+                        # 如果code为空，将对应的ID和冗余字段设为None
                         obj_data[id_field] = None
+                        obj_data.update(
+                            self._build_related_fields(
+                                model_class, id_field[: -len("_id")], None
+                            )
+                        )
+            obj_data.update(self._resolve_reference_codes(codes))
 
-            # 检查记录的唯一性（排除当前记录）
-            path_uniqueness_fields = [
-                "category_id",
-                "assessment_unit_id",
-                "bridge_type_id",
-                "part_id",
-                "structure_id",
-                "component_type_id",
-                "component_form_id",
-                "disease_id",
-                "scale_id",
-                "quality_id",
-                "quantity_id",
-            ]
-
-            # 构建唯一性检查条件，合并现有值和更新值
+            # 检查记录的唯一性（排除当前记录），合并现有值和更新值
             uniqueness_conditions = []
-            for field in path_uniqueness_fields:
+            for field in PATH_UNIQUENESS_FIELDS:
                 # 优先使用更新数据中的值，否则使用现有记录的值
                 field_value = obj_data.get(field, getattr(db_obj, field, None))
                 if field_value is not None:
@@ -735,10 +1058,8 @@ class PathsService(BaseCRUDService[Paths, PathsCreate, PathsUpdate]):
 
             # 检查是否存在完全相同的路径记录（排除当前记录）
             if uniqueness_conditions:
-                stmt = select(Paths).where(
-                    and_(and_(*uniqueness_conditions), Paths.id != id)
-                )
-                if hasattr(Paths, "is_active"):
+                stmt = select(Paths).where(*uniqueness_conditions, Paths.id != id)
+                if _PATHS_HAS_IS_ACTIVE:
                     stmt = stmt.where(Paths.is_active == True)
                 existing_path = self.session.exec(stmt).first()
                 if existing_path:
@@ -756,10 +1077,7 @@ class PathsService(BaseCRUDService[Paths, PathsCreate, PathsUpdate]):
             if hasattr(db_obj, "updated_at"):
                 db_obj.updated_at = datetime.now(timezone.utc)
 
-            self.session.commit()
-            self.session.refresh(db_obj)
-
-            # 构建返回数据
+            # 提交前构建返回数据，提交后对象过期，避免 refresh 再查询一次
             response_data = {
                 "id": db_obj.id,
                 "code": db_obj.code,
@@ -769,110 +1087,125 @@ class PathsService(BaseCRUDService[Paths, PathsCreate, PathsUpdate]):
             # 添加各个ID对应的关联数据
             response_data.update(self._get_related_data(db_obj))
 
-            return PathsResponse(**response_data)
+            self.session.commit()
+            options_cache.clear()
+            self.session.expunge(db_obj)
 
-        except (NotFoundException, DuplicateException, ValidationException):
+            return PathsResponse.model_construct(**response_data)
+
+        except SQLAlchemyError as e:
             self.session.rollback()
-            raise
-        except Exception as e:
+            raise DatabaseException(f"更新失败: {e}", e) from e
+        except Exception:
             self.session.rollback()
-            raise Exception(f"更新失败: {str(e)}")
+            raise
 
-    def export_template(self) -> bytes:
+    def export_template(self) -> Iterator[bytes]:
         """
         导出路径Excel模板
 
         Returns:
-            Excel文件的字节内容
+            按块读取Excel文件内容的迭代器
         """
+        # 模板内容只随基础表变化，与选项共用缓存，基础表写入时一并失效
+        cached = options_cache.get("template")
+        if cached is not None:
+            return _iter_bytes_chunks(cached)
+
         try:
-            # 创建工作薄
-            wb = Workbook()
+            # 创建只写工作薄，按行流式写入
+            wb = Workbook(write_only=True)
 
             # 创建主工作表
-            ws_main = wb.active
-            ws_main.title = "路径数据"
-
-            # 定义表头
-            headers = [
-                "编码",
-                "名称",
-                "桥梁类别",
-                "评定单元",
-                "桥梁类型",
-                "部位",
-                "结构类型",
-                "部件类型",
-                "构件形式",
-                "病害类型",
-                "标度",
-                "定性描述",
-                "定量描述",
-            ]
+            ws_main = wb.create_sheet(title="路径数据")
+
+            # 调整列宽（只写模式下需在写入数据前设置）
+            for col in range(1, len(TEMPLATE_HEADERS) + 1):
+                ws_main.column_dimensions[get_column_letter(col)].width = 15
 
             # 写入表头
-            for col, header in enumerate(headers, 1):
-                cell = ws_main.cell(row=1, column=col, value=header)
+            header_cells = []
+            for header in TEMPLATE_HEADERS:
+                cell = WriteOnlyCell(ws_main, value=header)
                 # 设置表头样式
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(
-                    start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
-                )
+                cell.font = HEADER_FONT
+                cell.fill = HEADER_FILL
+                header_cells.append(cell)
+            ws_main.append(header_cells)
 
-            # 添加填写说明
-            instruction = "说明：请在下方填写数据，必须与参考数据表中的名称完全一致，编码可留空由系统自动生成"
-            ws_main.cell(row=2, column=1, value=instruction)
-            ws_main.merge_cells("A2:M2")
-            ws_main.cell(row=2, column=1).font = Font(color="FF0000", italic=True)
-
-            # 调整列宽
-            for col in range(1, len(headers) + 1):
-                ws_main.column_dimensions[
-                    ws_main.cell(row=1, column=col).column_letter
-                ].width = 15
+            # 添加填写说明，只写模式不支持合并单元格，文本会自然溢出到右侧空白列
+            instruction_cell = WriteOnlyCell(ws_main, value=TEMPLATE_INSTRUCTION)
+            instruction_cell.font = INSTRUCTION_FONT
+            ws_main.append([instruction_cell])
 
             # 创建参考数据工作表
             ws_ref = wb.create_sheet(title="参考数据")
-            all_options = self.get_options()
-            create_reference_data_sheet(ws_ref, all_options)
+            create_reference_data_sheet(ws_ref, rows=self._get_reference_rows())
 
             # 创建说明工作表
             ws_help = wb.create_sheet(title="填写说明")
             create_help_sheet(ws_help)
 
-            # 保存到字节流
+            # 先完整保存，保存出错时能在响应开始前抛出
             buffer = BytesIO()
-            wb.save(buffer)
-            buffer.seek(0)
-
-            return buffer.getvalue()
-
-        except Exception as e:
-            print(f"导出模板时出错: {e}")
-            traceback.print_exc()  # 追踪报错位置
-            raise Exception(f"导出模板失败: {str(e)}")
+            try:
+                wb.save(buffer)
+            finally:
+                # 内容已写入缓冲区，尽早释放工作薄
+                wb.close()
+                del wb
+            template = buffer.getvalue()
+            buffer.close()
+
+            options_cache.set("template", template)
+            return _iter_bytes_chunks(template)
+
+        except SQLAlchemyError as e:
+            logger.exception("导出模板时出错")
+            raise DatabaseException(f"导出模板失败: {e}", e) from e
+        except OSError as e:
+            logger.exception("导出模板时出错")
+            raise SystemException(f"导出模板失败: {e}", e) from e
 
     def import_from_excel(self, file_content: bytes, filename: str) -> Dict[str, Any]:
         """
         从Excel导入路径数据
 
         Args:
-            file_content: Excel文件内容
+            file_content: Excel文件内容（.xlsx，由 validate_excel_data 以只读模式流式读取）
             filename: 文件名
 
         Returns:
             导入结果报告
         """
+        # 解析前先按文件名、文件头和大小拒绝非 xlsx 文件
+        if not filename.lower().endswith(".xlsx") or not file_content.startswith(
+            XLSX_MAGIC
+        ):
+            raise ValidationException("文件格式错误，仅支持.xlsx格式的Excel文件")
+        if len(file_content) > settings.MAX_IMPORT_BYTES:
+            raise ValidationException(
+                f"文件大小超过限制（{settings.MAX_IMPORT_BYTES // (1024 * 1024)}MB）"
+            )
+
         try:
-            # 获取参考数据
-            all_options = self.get_options()
-            reference_data = get_reference_data(all_options)
+            # 获取参考数据，整个导入过程只构建一次
+            reference_data = self._get_reference_data()
+
+            # 匹配函数包装器，同一列的重复值只匹配一次
+            match_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
 
-            # 匹配函数包装器
             def match_func(
                 input_name: str, ref_key: str, ref_data: Dict[str, Dict[str, str]]
             ) -> Dict[str, Any]:
-                return match_name_to_code(input_name, ref_key, ref_data, self.session)
+                key = (ref_key, input_name)
+                result = match_cache.get(key)
+                if result is None:
+                    result = match_name_to_code(
+                        input_name, ref_key, ref_data, self.session
+                    )
+                    match_cache[key] = result
+                return result
 
             # 验证数据
             validation_result = validate_excel_data(
@@ -908,45 +1241,35 @@ class PathsService(BaseCRUDService[Paths, PathsCreate, PathsUpdate]):
 
             # 导入有效数据
             valid_rows = validation_result["valid_rows"]
-            imported_count = 0
             import_errors = []
 
+            path_creates = []
+            row_numbers = []
             for row_index, row_data in enumerate(valid_rows):
                 try:
-                    # 创建路径记录
-                    path_create = PathsCreate(
-                        code=row_data.get("code", ""),
-                        name=row_data["name"],
-                        category_code=row_data["category_code"],
-                        assessment_unit_code=row_data.get("assessment_unit_code"),
-                        bridge_type_code=row_data["bridge_type_code"],
-                        part_code=row_data["part_code"],
-                        structure_code=row_data.get("structure_code"),
-                        component_type_code=row_data.get("component_type_code"),
-                        component_form_code=row_data.get("component_form_code"),
-                        disease_code=row_data["disease_code"],
-                        scale_code=row_data["scale_code"],
-                        quality_code=row_data.get("quality_code"),
-                        quantity_code=row_data.get("quantity_code"),
-                    )
-
-                    # 调用创建方法
-                    result = self.create(path_create)
-                    if result:
-                        imported_count += 1
-                    else:
-                        import_errors.append(
-                            {
-                                "row": row_index + 4,
-                                "error": "创建记录失败",
-                            }
-                        )
-
-                except Exception as e:
+                    # 编码和名称是仅有的自由输入，超长时走完整校验以返回相同的错误
+                    if (
+                        len(row_data["name"]) > PATH_NAME_MAX_LENGTH
+                        or len(row_data.get("code") or "") > PATH_CODE_MAX_LENGTH
+                    ):
+                        PathsCreate(**row_data)
+
+                    # 数据已在 validate_excel_data 中校验，跳过重复校验
+                    path_creates.append(PathsCreate.model_construct(**row_data))
+                    row_numbers.append(row_index + 4)
+                except PydanticValidationError as e:
                     import_errors.append(
                         {"row": row_index + 4, "error": f"导入失败: {str(e)}"}
                     )
 
+            # 批量创建路径记录
+            imported_count, create_errors = self._bulk_create(path_creates)
+            for index, error in create_errors.items():
+                import_errors.append(
+                    {"row": row_numbers[index], "error": f"导入失败: {error}"}
+                )
+            import_errors.sort(key=lambda item: item["row"])
+
             failed_count = len(import_errors)
             skipped_count = invalid_rows_count
             message = f"导入完成，共导入 {imported_count} 条数据，共失败 {failed_count} 条，共无效 {skipped_count} 条"
@@ -961,10 +1284,14 @@ class PathsService(BaseCRUDService[Paths, PathsCreate, PathsUpdate]):
                 "validation_result": validation_result,
             }
 
+        except ValidationException:
+            raise
+        except SQLAlchemyError as e:
+            logger.exception("导入Excel数据时出错")
+            raise DatabaseException(f"文件处理失败: {e}", e) from e
         except Exception as e:
-            print(f"导入Excel数据时出错: {e}")
-            traceback.print_exc()
-            raise Exception(f"文件处理失败: {str(e)}")
+            logger.exception("导入Excel数据时出错")
+            raise SystemException(f"文件处理失败: {e}", e) from e
 
 
 def get_paths_service(session: Session) -> PathsService:
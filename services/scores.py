@@ -1,8 +1,23 @@
-from typing import List, Optional, Dict, Any, Tuple
-from sqlmodel import Session, select, and_, func
+from typing import List, Optional, Dict, Any, Sequence, Tuple
+from sqlmodel import Session, select, and_, or_, func
+from datetime import datetime
 from decimal import Decimal
 from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
+from sqlalchemy import (
+    RowMapping,
+    case,
+    exists,
+    insert,
+    literal,
+    null,
+    tuple_,
+    union_all,
+)
 from sqlalchemy.exc import IntegrityError
+import copy
+import logging
 import math
 
 from models import (
@@ -37,6 +52,12 @@ from services.bridge_component_service import get_bridge_component_service
 from services.t import TService
 from exceptions import NotFoundException
 from utils.base import get_rating_by_score
+from utils.cache import cascade_options_cache, options_cache
+
+logger = logging.getLogger(__name__)
+
+# 调整后权重（暂未实现计算逻辑，统一为 0）
+_ZERO_WEIGHT = Decimal("0.0000")
 
 
 class ScoresService:
@@ -45,6 +66,54 @@ class ScoresService:
     def __init__(self, session: Session):
         self.session = session
 
+    @staticmethod
+    def _saved_scores_conditions(request: ScoreListRequest) -> List[Any]:
+        """scores表已保存数据的过滤条件"""
+        conditions = [
+            Scores.bridge_instance_name == request.bridge_instance_name,
+            Scores.bridge_type_id == request.bridge_type_id,
+            Scores.is_active == True,
+        ]
+
+        if request.assessment_unit_instance_name:
+            conditions.append(
+                Scores.assessment_unit_instance_name
+                == request.assessment_unit_instance_name
+            )
+        else:
+            conditions.append(Scores.assessment_unit_instance_name.is_(None))
+
+        if request.user_id:
+            conditions.append(Scores.user_id == request.user_id)
+        else:
+            conditions.append(Scores.user_id.is_(None))
+
+        return conditions
+
+    def _saved_scores_subquery(self, request: ScoreListRequest):
+        """
+        scores表已保存数据的子查询，每个 (part_id, component_type_id) 只取最新一条，
+        与 _get_saved_scores_data 中后出现的记录覆盖先前记录一致
+        """
+        latest_ids = (
+            select(func.max(Scores.id).label("id"))
+            .where(and_(*self._saved_scores_conditions(request)))
+            .group_by(Scores.part_id, Scores.component_type_id)
+            .subquery()
+        )
+        return (
+            select(
+                Scores.id,
+                Scores.part_id,
+                Scores.component_type_id,
+                Scores.component_count,
+                Scores.custom_component_count,
+                Scores.adjusted_weight,
+            )
+            .join(latest_ids, Scores.id == latest_ids.c.id)
+            .subquery()
+        )
+
     def _get_saved_scores_data(
         self, request: ScoreListRequest
     ) -> Optional[Dict[Tuple[int, int], Dict[str, Any]]]:
@@ -57,90 +126,75 @@ class ScoresService:
         Returns:
             保存的scores数据字典 {(part_id, component_type_id): {数据}}，如果没有数据返回None
         """
-        try:
-            conditions = [
-                Scores.bridge_instance_name == request.bridge_instance_name,
-                Scores.bridge_type_id == request.bridge_type_id,
-                Scores.is_active == True,
-            ]
-
-            if request.assessment_unit_instance_name:
-                conditions.append(
-                    Scores.assessment_unit_instance_name
-                    == request.assessment_unit_instance_name
-                )
-            else:
-                conditions.append(Scores.assessment_unit_instance_name.is_(None))
-
-            if request.user_id:
-                conditions.append(Scores.user_id == request.user_id)
-            else:
-                conditions.append(Scores.user_id.is_(None))
+        conditions = self._saved_scores_conditions(request)
 
-            stmt = select(
-                Scores.part_id,
-                Scores.component_type_id,
-                Scores.component_count,
-                Scores.custom_component_count,
-                Scores.adjusted_weight,
-            ).where(and_(*conditions))
-
-            results = self.session.exec(stmt).all()
+        stmt = select(
+            Scores.part_id,
+            Scores.component_type_id,
+            Scores.component_count,
+            Scores.custom_component_count,
+            Scores.adjusted_weight,
+        ).where(and_(*conditions))
 
-            if not results:
-                return None
+        results = self.session.exec(stmt).all()
 
-            saved_data = {}
-            for row in results:
-                key = (row.part_id, row.component_type_id)
-                saved_data[key] = {
-                    "component_count": row.component_count,
-                    "custom_component_count": row.custom_component_count
-                    or row.component_count,
-                    "adjusted_weight": row.adjusted_weight or Decimal("0"),
-                }
+        if not results:
+            return None
 
-            return saved_data
+        saved_data = {}
+        for row in results:
+            key = (row.part_id, row.component_type_id)
+            saved_data[key] = {
+                "component_count": row.component_count,
+                "custom_component_count": row.custom_component_count
+                or row.component_count,
+                "adjusted_weight": row.adjusted_weight or Decimal("0"),
+            }
 
-        except Exception as e:
-            print(f"查询scores表保存数据失败: {e}")
-            return None
+        return saved_data
 
     def get_score_list(
-        self, request: ScoreListRequest
+        self, request: ScoreListRequest, page_params: Optional[PageParams] = None
     ) -> Tuple[List[Dict[str, Any]], int]:
         """
         获取权重分配列表数据
 
         Args:
             request: 查询请求参数
+            page_params: 分页参数（可选），传入时在数据库中分页，只统计当前页的构件数量
 
         Returns:
             评分数据字典列表和总数的元组
         """
         try:
-            weight_data = self._get_weight_data(request)
+            # 权重、构件数量与已保存数据一次查询取回
+            weight_data = self._get_weight_data(
+                request,
+                with_component_counts=True,
+                with_saved_scores=True,
+                page_params=page_params,
+            )
+            total = (
+                self._count_weight_data(request) if page_params else len(weight_data)
+            )
 
             if not weight_data:
-                return [], 0
-
-            saved_scores_data = self._get_saved_scores_data(request)
+                return [], total
 
+            # 未保存数据的调整后权重相同，循环外转换一次
+            zero_weight = float(_ZERO_WEIGHT)
             score_data = []
             for item in weight_data:
-                key = (item["part_id"], item["component_type_id"])
-
-                if saved_scores_data and key in saved_scores_data:
-                    saved_item = saved_scores_data[key]
-                    component_count = saved_item["component_count"]
-                    custom_count = saved_item["custom_component_count"]
-                    adjusted_weight = saved_item["adjusted_weight"]
+                if item["saved_id"] is not None:
+                    component_count = item["saved_component_count"]
+                    custom_count = (
+                        item["saved_custom_component_count"] or component_count
+                    )
+                    adjusted_weight = float(item["saved_adjusted_weight"] or 0)
                 else:
-                    component_count = self._count_components_from_paths(request, item)
+                    component_count = item["component_count"]
                     custom_count = component_count
-                    adjusted_weight = self._calculate_adjusted_weight(
-                        item["weight"], custom_count
-                    )
+                    adjusted_weight = zero_weight
 
                 score_item = {
                     "part_id": item["part_id"],
@@ -150,110 +204,166 @@ class ScoresService:
                     "weight": float(item["weight"]),
                     "component_count": component_count,
                     "custom_component_count": custom_count,
-                    "adjusted_weight": float(adjusted_weight),
+                    "adjusted_weight": adjusted_weight,
                 }
                 score_data.append(score_item)
 
-            return score_data, len(score_data)
+            return score_data, total
 
         except Exception as e:
-            raise Exception(f"获取权重分配列表失败: {str(e)}")
+            logger.exception("获取权重分配列表失败")
+            raise Exception(f"获取权重分配列表失败: {str(e)}") from e
+
+    @staticmethod
+    def _weight_conditions(request: ScoreListRequest) -> List[Any]:
+        """权重数据的公共过滤条件"""
+        return [
+            WeightReferences.bridge_type_id == request.bridge_type_id,
+            WeightReferences.is_active == True,
+        ]
+
+    def _count_weight_data(self, request: ScoreListRequest) -> int:
+        """统计权重数据总数，不计算构件数量"""
+        stmt = (
+            select(func.count())
+            .select_from(WeightReferences)
+            .join(BridgeParts, WeightReferences.part_id == BridgeParts.id)
+            .join(
+                BridgeComponentTypes,
+                WeightReferences.component_type_id == BridgeComponentTypes.id,
+            )
+            .where(and_(*self._weight_conditions(request)))
+        )
+        return self.session.exec(stmt).one()
 
-    def _get_weight_data(self, request: ScoreListRequest) -> List[Dict[str, Any]]:
+    def _get_weight_data(
+        self,
+        request: ScoreListRequest,
+        with_component_counts: bool = False,
+        with_saved_scores: bool = False,
+        page_params: Optional[PageParams] = None,
+    ) -> Sequence[RowMapping]:
         """
         获取权重数据
         从weight_references表查询权重，按bridge_type_id到component_type_id链路
-        """
-        try:
-            conditions = [
-                WeightReferences.bridge_type_id == request.bridge_type_id,
-                WeightReferences.is_active == True,
-            ]
+        过滤、排序和取值均由 idx_weight_references_score_lookup 索引覆盖
 
-            stmt = (
-                select(
-                    WeightReferences.part_id,
-                    WeightReferences.structure_id,
-                    WeightReferences.component_type_id,
-                    WeightReferences.weight,
-                    BridgeParts.name.label("part_name"),
-                    BridgeComponentTypes.name.label("component_type_name"),
-                )
-                .join(BridgeParts, WeightReferences.part_id == BridgeParts.id)
-                .join(
-                    BridgeComponentTypes,
-                    WeightReferences.component_type_id == BridgeComponentTypes.id,
-                )
-                .where(and_(*conditions))
-                .order_by(
-                    WeightReferences.part_id,
-                    WeightReferences.component_type_id,
-                )
-            )
+        Args:
+            request: 查询请求参数
+            with_component_counts: 是否同时返回构件数量（见 _component_count_column）
+            with_saved_scores: 是否同时左连接scores表已保存数据（saved_ 前缀字段）
+            page_params: 分页参数（可选），LIMIT/OFFSET 下推到数据库
 
-            results = self.session.exec(stmt).all()
+        Returns:
+            权重行列表，weight 为 Decimal，由调用方按需转换
+        """
+        conditions = self._weight_conditions(request)
 
-            weight_data = []
-            for row in results:
-                weight_data.append(
-                    {
-                        "part_id": row.part_id,
-                        "part_name": row.part_name,
-                        "structure_id": row.structure_id,
-                        "component_type_id": row.component_type_id,
-                        "component_type_name": row.component_type_name,
-                        "weight": row.weight,
-                    }
-                )
+        columns = [
+            WeightReferences.part_id,
+            WeightReferences.structure_id,
+            WeightReferences.component_type_id,
+            WeightReferences.weight,
+            BridgeParts.name.label("part_name"),
+            BridgeComponentTypes.name.label("component_type_name"),
+        ]
+        if with_component_counts:
+            columns.append(self._component_count_column())
+
+        # 显式 JOIN 一次取回部位、部件类型名称；若改为返回 ORM 对象，
+        # 需配合 selectinload 预加载关联，避免逐行懒加载产生 N+1 查询
+        stmt = (
+            select(*columns)
+            .join(BridgeParts, WeightReferences.part_id == BridgeParts.id)
+            .join(
+                BridgeComponentTypes,
+                WeightReferences.component_type_id == BridgeComponentTypes.id,
+            )
+            .where(and_(*conditions))
+            .order_by(
+                WeightReferences.part_id,
+                WeightReferences.component_type_id,
+            )
+        )
+        if with_saved_scores:
+            saved = self._saved_scores_subquery(request)
+            stmt = stmt.add_columns(
+                saved.c.id.label("saved_id"),
+                saved.c.component_count.label("saved_component_count"),
+                saved.c.custom_component_count.label("saved_custom_component_count"),
+                saved.c.adjusted_weight.label("saved_adjusted_weight"),
+            ).outerjoin(
+                saved,
+                and_(
+                    saved.c.part_id == WeightReferences.part_id,
+                    saved.c.component_type_id == WeightReferences.component_type_id,
+                ),
+            )
+        if page_params:
+            stmt = stmt.offset(page_params.offset).limit(page_params.size)
 
-            return weight_data
+        # 列名即返回字段名，调用方只读取，直接返回行映射不再复制为字典
+        return self.session.execute(stmt).mappings().all()
 
-        except Exception as e:
-            print(f"查询权重数据失败: {e}")
-            return []
+    def _get_excluded_component_form_ids(self) -> List[int]:
+        """
+        获取不计入构件数量的构件形式ID（名称为"-"、为空或已停用），与选项共用缓存
+        """
+        cached = options_cache.get("excluded_component_form_ids")
+        if cached is not None:
+            return cached
+
+        stmt = select(BridgeComponentForms.id).where(
+            or_(
+                BridgeComponentForms.name == "-",
+                BridgeComponentForms.name.is_(None),
+                BridgeComponentForms.is_active == False,
+            )
+        )
+        excluded_ids = self.session.exec(stmt).all()
+        options_cache.set("excluded_component_form_ids", excluded_ids)
+        return excluded_ids
 
-    def _count_components_from_paths(
-        self, request: ScoreListRequest, weight_item: Dict[str, Any]
-    ) -> int:
+    def _component_form_conditions(self) -> List[Any]:
         """
-        统计构件数量
-        统计paths表中对应权重链路的记录数量，排除构件形式为"-"的记录
+        计入构件数量的构件形式条件，用预先取出的排除ID代替关联构件形式表的名称和状态判断，
+        并保留构件形式记录存在的检查，已删除构件形式的路径不计入
         """
-        try:
-            conditions = [
-                Paths.bridge_type_id == request.bridge_type_id,
-                Paths.part_id == weight_item["part_id"],
-                Paths.component_type_id == weight_item["component_type_id"],
-                Paths.is_active == True,
-                Paths.component_form_id.is_not(None),  # 排除空值
-            ]
+        conditions = [
+            Paths.component_form_id.is_not(None),  # 排除空值
+            exists().where(BridgeComponentForms.id == Paths.component_form_id),
+        ]
+        excluded_ids = self._get_excluded_component_form_ids()
+        if excluded_ids:
+            conditions.append(Paths.component_form_id.not_in(excluded_ids))
+        return conditions
 
-            # 结构类型过滤
-            if weight_item.get("structure_id"):
-                conditions.append(Paths.structure_id == weight_item["structure_id"])
+    def _component_count_column(self):
+        """
+        构件数量的关联子查询，随权重数据一并查询
+        未指定结构类型的权重统计该部件下全部结构的构件形式
 
-            # 统计符合条件的paths记录数量，排除构件形式为"-"的记录
-            stmt = (
-                select(func.count(func.distinct(Paths.component_form_id)))
-                .join(
-                    BridgeComponentForms,
-                    Paths.component_form_id == BridgeComponentForms.id,
-                )
-                .where(
-                    and_(
-                        *conditions,
-                        BridgeComponentForms.name != "-",  # 排除构件形式为"-"的记录
-                        BridgeComponentForms.is_active == True,
-                    )
-                )
+        每条权重按 paths 表的 idx_paths_component_count 索引
+        (bridge_type_id, part_id, component_type_id, component_form_id, is_active,
+        structure_id) 定位，去重所需的构件形式ID直接从索引读取，无需回表
+        """
+        return (
+            select(func.count(func.distinct(Paths.component_form_id)))
+            .where(
+                Paths.bridge_type_id == WeightReferences.bridge_type_id,
+                Paths.part_id == WeightReferences.part_id,
+                Paths.component_type_id == WeightReferences.component_type_id,
+                or_(
+                    WeightReferences.structure_id.is_(None),
+                    Paths.structure_id == WeightReferences.structure_id,
+                ),
+                Paths.is_active == True,
+                *self._component_form_conditions(),
             )
-
-            count = self.session.exec(stmt).first() or 0
-            return count
-
-        except Exception as e:
-            print(f"统计构件数量失败: {e}")
-            return 0
+            .correlate(WeightReferences)
+            .scalar_subquery()
+            .label("component_count")
+        )
 
     def _calculate_adjusted_weight(
         self, weight: Decimal, component_count: int
@@ -262,13 +372,7 @@ class ScoresService:
         计算调整后权重
         目前暂时设为 0，后续会实现具体的计算逻辑
         """
-        try:
-            # 暂时返回 0，后续实现计算逻辑
-            return Decimal("0.0000")
-
-        except Exception as e:
-            print(f"计算调整后权重失败: {e}")
-            return Decimal("0.0000")
+        return _ZERO_WEIGHT
 
     def get_cascade_options(
         self,
@@ -286,137 +390,136 @@ class ScoresService:
         Returns:
             级联选项字典
         """
-        try:
-            bridge_instance_options = self._get_bridge_instance_options(user_id)
+        # 相同筛选条件短时间内直接返回缓存结果，返回副本避免调用方修改缓存
+        cache_key = (
+            "scores",
+            bridge_instance_name,
+            assessment_unit_instance_name,
+            user_id,
+        )
+        cached = cascade_options_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
 
-            assessment_unit_instance_options = (
-                self._get_assessment_unit_instance_options(
+        try:
+            # 三类选项合并为一次 UNION ALL 查询，按选项类型和名称排序后分组
+            # 各分支用 GROUP BY 去重，可走 idx_user_paths_cascade_options 索引
+            stmt = union_all(
+                self._bridge_instance_options_stmt(user_id),
+                self._assessment_unit_instance_options_stmt(
                     bridge_instance_name, user_id
-                )
-            )
-
-            bridge_type_options = self._get_bridge_type_options_for_scores(
-                bridge_instance_name, assessment_unit_instance_name, user_id
-            )
-
-            return {
-                "bridge_instance_options": bridge_instance_options,
-                "assessment_unit_instance_options": assessment_unit_instance_options,
-                "bridge_type_options": bridge_type_options,
+                ),
+                self._bridge_type_options_stmt(
+                    bridge_instance_name, assessment_unit_instance_name, user_id
+                ),
+            ).order_by("option_type", "name")
+
+            options = {
+                "bridge_instance_options": [],
+                "assessment_unit_instance_options": [],
+                "bridge_type_options": [],
             }
+            for option_type, option_id, name in self.session.execute(stmt):
+                if option_type == "bridge_type":
+                    options["bridge_type_options"].append(
+                        {"id": option_id, "name": name}
+                    )
+                elif option_type == "bridge_instance":
+                    if name:
+                        options["bridge_instance_options"].append({"name": name})
+                elif name is not None:
+                    options["assessment_unit_instance_options"].append({"name": name})
 
-        except Exception as e:
-            print(f"获取级联选项时出错: {e}")
-            raise Exception(f"获取级联选项失败: {str(e)}")
-
-    def _get_bridge_instance_options(
-        self, user_id: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
-        """获取桥梁实例名称选项"""
-        try:
-            conditions = [UserPaths.is_active == True]
-            if user_id is not None:
-                conditions.append(UserPaths.user_id == user_id)
-            else:
-                conditions.append(UserPaths.user_id.is_(None))
-
-            stmt = (
-                select(UserPaths.bridge_instance_name)
-                .where(and_(*conditions))
-                .distinct()
-                .order_by(UserPaths.bridge_instance_name)
-            )
-
-            results = self.session.exec(stmt).all()
-            return [{"name": name} for name in results if name]
+            cascade_options_cache.set(cache_key, options)
+            return copy.deepcopy(options)
 
         except Exception as e:
-            print(f"获取桥梁实例名称选项时出错: {e}")
-            return []
+            logger.exception("获取级联选项失败")
+            raise Exception(f"获取级联选项失败: {str(e)}") from e
+
+    @staticmethod
+    def _user_conditions(user_id: Optional[int]) -> List[Any]:
+        """用户路径的公共过滤条件"""
+        conditions = [UserPaths.is_active == True]
+        if user_id is not None:
+            conditions.append(UserPaths.user_id == user_id)
+        else:
+            conditions.append(UserPaths.user_id.is_(None))
+        return conditions
+
+    def _bridge_instance_options_stmt(self, user_id: Optional[int] = None):
+        """桥梁实例名称选项查询"""
+        conditions = self._user_conditions(user_id)
+
+        return (
+            select(
+                literal("bridge_instance").label("option_type"),
+                null().label("id"),
+                UserPaths.bridge_instance_name.label("name"),
+            )
+            .where(and_(*conditions))
+            .group_by(UserPaths.bridge_instance_name)
+        )
 
-    def _get_assessment_unit_instance_options(
+    def _assessment_unit_instance_options_stmt(
         self, bridge_instance_name: Optional[str], user_id: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
-        """获取评定单元实例名称选项"""
-        try:
-            conditions = [UserPaths.is_active == True]
+    ):
+        """评定单元实例名称选项查询"""
+        conditions = self._user_conditions(user_id)
 
-            if user_id is not None:
-                conditions.append(UserPaths.user_id == user_id)
-            else:
-                conditions.append(UserPaths.user_id.is_(None))
-
-            if bridge_instance_name:
-                conditions.append(
-                    UserPaths.bridge_instance_name == bridge_instance_name
-                )
-            else:
-                conditions.append(UserPaths.assessment_unit_instance_name.is_(None))
+        if bridge_instance_name:
+            conditions.append(UserPaths.bridge_instance_name == bridge_instance_name)
+        else:
+            conditions.append(UserPaths.assessment_unit_instance_name.is_(None))
 
-            stmt = (
-                select(UserPaths.assessment_unit_instance_name)
-                .where(and_(*conditions))
-                .distinct()
-                .order_by(UserPaths.assessment_unit_instance_name)
+        return (
+            select(
+                literal("assessment_unit_instance").label("option_type"),
+                null().label("id"),
+                UserPaths.assessment_unit_instance_name.label("name"),
             )
+            .where(and_(*conditions))
+            .group_by(UserPaths.assessment_unit_instance_name)
+        )
 
-            results = self.session.exec(stmt).all()
-            return [{"name": name} for name in results if name is not None]
-
-        except Exception as e:
-            print(f"获取评定单元实例名称选项时出错: {e}")
-            return []
-
-    def _get_bridge_type_options_for_scores(
+    def _bridge_type_options_stmt(
         self,
         bridge_instance_name: Optional[str],
         assessment_unit_instance_name: Optional[str],
         user_id: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
-        """获取桥梁类型选项"""
-        try:
-            conditions = [UserPaths.is_active == True]
-
-            if bridge_instance_name:
-                conditions.append(
-                    UserPaths.bridge_instance_name == bridge_instance_name
-                )
-            else:
-                conditions.append(UserPaths.bridge_type_id.is_(None))
+    ):
+        """桥梁类型选项查询"""
+        conditions = self._user_conditions(user_id)
 
-            if user_id is not None:
-                conditions.append(UserPaths.user_id == user_id)
-            else:
-                conditions.append(UserPaths.user_id.is_(None))
-
-            if assessment_unit_instance_name:
-                conditions.append(
-                    UserPaths.assessment_unit_instance_name
-                    == assessment_unit_instance_name
-                )
-            else:
-                conditions.append(UserPaths.assessment_unit_id.is_(None))
+        if bridge_instance_name:
+            conditions.append(UserPaths.bridge_instance_name == bridge_instance_name)
+        else:
+            conditions.append(UserPaths.bridge_type_id.is_(None))
 
-            # 查询桥梁类型ID并关联桥梁类型表获取名称
-            stmt = (
-                select(UserPaths.bridge_type_id, BridgeTypes.name)
-                .join(BridgeTypes, UserPaths.bridge_type_id == BridgeTypes.id)
-                .where(
-                    and_(
-                        *conditions,
-                        BridgeTypes.is_active == True,
-                    )
+        if assessment_unit_instance_name:
+            conditions.append(
+                UserPaths.assessment_unit_instance_name
+                == assessment_unit_instance_name
+            )
+        else:
+            conditions.append(UserPaths.assessment_unit_id.is_(None))
+
+        # 查询桥梁类型ID并关联桥梁类型表获取名称
+        return (
+            select(
+                literal("bridge_type").label("option_type"),
+                UserPaths.bridge_type_id.label("id"),
+                BridgeTypes.name.label("name"),
+            )
+            .join(BridgeTypes, UserPaths.bridge_type_id == BridgeTypes.id)
+            .where(
+                and_(
+                    *conditions,
+                    BridgeTypes.is_active == True,
                 )
-                .distinct()
-                .order_by(BridgeTypes.name)
             )
-
-            results = self.session.exec(stmt).all()
-            return [{"id": r[0], "name": r[1]} for r in results]
-
-        except Exception as e:
-            print(f"获取桥梁类型选项时出错: {e}")
-            return []
+            .group_by(UserPaths.bridge_type_id, BridgeTypes.name)
+        )
 
     def _prepare_component_counts(
         self,
@@ -435,27 +538,20 @@ class ScoresService:
         Returns:
             构件数量字典 {(part_id, component_type_id): count}
         """
-        component_counts = {}
-
-        if allocation_request.calculation_mode == CalculationMode.DEFAULT:
-            for item in weight_data:
-                key = (item["part_id"], item["component_type_id"])
-                count = self._count_components_from_paths(score_request, item)
-                component_counts[key] = count
-        else:
-            custom_counts = {
-                (item.part_id, item.component_type_id): item.custom_component_count
-                for item in allocation_request.custom_component_counts
-            }
-
-            for item in weight_data:
-                key = (item["part_id"], item["component_type_id"])
-                # 优先使用自定义数量，否则使用默认数量
-                if key in custom_counts:
-                    component_counts[key] = custom_counts[key]
-                else:
-                    count = self._count_components_from_paths(score_request, item)
-                    component_counts[key] = count
+        # 默认使用随权重查询的构件数量
+        component_counts = {
+            (item["part_id"], item["component_type_id"]): item["component_count"]
+            for item in weight_data
+        }
+
+        # 自定义数量优先（多出的部件不会被权重分配读取）
+        if allocation_request.calculation_mode != CalculationMode.DEFAULT:
+            component_counts.update(
+                {
+                    (item.part_id, item.component_type_id): item.custom_component_count
+                    for item in allocation_request.custom_component_counts
+                }
+            )
 
         return component_counts
 
@@ -520,32 +616,31 @@ class ScoresService:
         应用权重分配规则
 
         Args:
-            weight_data: 权重数据
+            weight_data: 权重数据（按 part_id 排序）
             component_counts: 构件数量数据
 
         Returns:
             应用权重分配规则后的数据列表
         """
-        # 按部位分组
-        parts_data = defaultdict(list)
-        for item in weight_data:
-            key = (item["part_id"], item["component_type_id"])
-            default_count = component_counts.get(key, 0)
-
-            enhanced_item = {
-                **item,
-                "default_component_count": default_count,
-                "used_component_count": default_count,
-                "original_weight": item["weight"],
-                "adjusted_weight": item["weight"],
-            }
-            parts_data[item["part_id"]].append(enhanced_item)
-
-        # 对每个部位应用权重分配规则
+        # 权重数据已按 part_id 排序，逐部位分组后直接应用权重分配规则
         result_data = []
-        for part_id, items in parts_data.items():
-            allocated_items = self._allocate_weights_for_part(items)
-            result_data.extend(allocated_items)
+        for _, part_items in groupby(weight_data, key=itemgetter("part_id")):
+            items = []
+            for item in part_items:
+                key = (item["part_id"], item["component_type_id"])
+                default_count = component_counts.get(key, 0)
+
+                items.append(
+                    {
+                        **item,
+                        "default_component_count": default_count,
+                        "used_component_count": default_count,
+                        "original_weight": item["weight"],
+                        "adjusted_weight": item["weight"],
+                    }
+                )
+
+            result_data.extend(self._allocate_weights_for_part(items))
 
         return result_data
 
@@ -568,7 +663,9 @@ class ScoresService:
                 assessment_unit_instance_name=request.assessment_unit_instance_name,
             )
 
-            weight_data = self._get_weight_data(score_request)
+            weight_data = self._get_weight_data(
+                score_request, with_component_counts=True
+            )
             if not weight_data:
                 return [], 0
 
@@ -624,10 +721,9 @@ class ScoresService:
         else:
             conditions.append(Scores.assessment_unit_instance_name.is_(None))
 
-        stmt = select(func.count(Scores.id)).where(and_(*conditions))
-        count = self.session.exec(stmt).one()
-
-        return count == 0
+        # 只需判断是否存在记录，取到第一条即停止，无需 COUNT 全部匹配行
+        stmt = select(Scores.id).where(and_(*conditions)).limit(1)
+        return self.session.exec(stmt).first() is None
 
     def _get_structure_ids(
         self, request: WeightAllocationSaveRequest
@@ -676,29 +772,36 @@ class ScoresService:
         """
         use_custom_count = request.calculation_mode == CalculationMode.CUSTOM
 
-        scores_list = []
-        for item in request.items:
-            key = (item.part_id, item.component_type_id)
-            structure_id = structure_id_map.get(key)
-
-            score_record = Scores(
-                bridge_instance_name=request.bridge_instance_name,
-                assessment_unit_instance_name=request.assessment_unit_instance_name,
-                bridge_type_id=request.bridge_type_id,
-                part_id=item.part_id,
-                structure_id=structure_id,
-                component_type_id=item.component_type_id,
-                weight=item.weight,
-                component_count=item.component_count,
-                custom_component_count=item.custom_component_count,
-                adjusted_weight=item.adjusted_weight,
-                use_custom_count=use_custom_count,
-                is_active=True,
-            )
-            scores_list.append(score_record)
+        # 公共字段，默认值与 Scores 模型一致
+        now = datetime.utcnow()
+        row_template = {
+            "bridge_instance_name": request.bridge_instance_name,
+            "assessment_unit_instance_name": request.assessment_unit_instance_name,
+            "bridge_type_id": request.bridge_type_id,
+            "use_custom_count": use_custom_count,
+            "is_active": True,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+        rows = [
+            {
+                **row_template,
+                "part_id": item.part_id,
+                "structure_id": structure_id_map.get(
+                    (item.part_id, item.component_type_id)
+                ),
+                "component_type_id": item.component_type_id,
+                "weight": item.weight,
+                "component_count": item.component_count,
+                "custom_component_count": item.custom_component_count,
+                "adjusted_weight": item.adjusted_weight,
+            }
+            for item in request.items
+        ]
 
-        # 批量插入
-        self.session.add_all(scores_list)
+        # 批量插入，不经过 ORM 工作单元，按 executemany 一次提交
+        self.session.execute(insert(Scores), rows)
 
     def _batch_update_scores(self, request: WeightAllocationSaveRequest) -> None:
         """
@@ -723,27 +826,49 @@ class ScoresService:
         else:
             base_conditions.append(Scores.assessment_unit_instance_name.is_(None))
 
-        # 更新
-        for item in request.items:
-            conditions = base_conditions + [
-                Scores.part_id == item.part_id,
-                Scores.component_type_id == item.component_type_id,
-            ]
-
-            update_data = {
-                "adjusted_weight": item.adjusted_weight,
-                "use_custom_count": use_custom_count,
-            }
+        # 同一部件多次出现时以最后一条为准，与逐条更新的结果一致
+        items = {(item.part_id, item.component_type_id): item for item in request.items}
+        if not items:
+            return
+
+        # 按 (part_id, component_type_id) 用 CASE 生成各行的值，一条 UPDATE 完成
+        def case_by_key(field: str):
+            return case(
+                *[
+                    (
+                        and_(
+                            Scores.part_id == part_id,
+                            Scores.component_type_id == ct_id,
+                        ),
+                        getattr(item, field),
+                    )
+                    for (part_id, ct_id), item in items.items()
+                ],
+                else_=getattr(Scores, field),
+            )
 
-            # 自定义构件计算，更新自定义构件数量
-            if use_custom_count:
-                update_data["custom_component_count"] = item.custom_component_count
+        update_data = {
+            "adjusted_weight": case_by_key("adjusted_weight"),
+            "use_custom_count": use_custom_count,
+        }
 
-            stmt = (
-                Scores.__table__.update().where(and_(*conditions)).values(**update_data)
+        # 自定义构件计算，更新自定义构件数量
+        if use_custom_count:
+            update_data["custom_component_count"] = case_by_key(
+                "custom_component_count"
             )
 
-            self.session.execute(stmt)
+        stmt = (
+            Scores.__table__.update()
+            .where(
+                and_(
+                    *base_conditions,
+                    tuple_(Scores.part_id, Scores.component_type_id).in_(list(items)),
+                )
+            )
+            .values(**update_data)
+        )
+        self.session.execute(stmt)
 
     def save_weight_allocation(self, request: WeightAllocationSaveRequest) -> bool:
         """
@@ -759,11 +884,9 @@ class ScoresService:
             # 检查是否为第一次保存
             is_first_save = self._is_first_save(request)
 
-            # 获取structure_id映射
-            structure_id_map = self._get_structure_ids(request)
-
             if is_first_save:
-                # 第一次保存批量插入所有记录
+                # 第一次保存批量插入所有记录，只有插入时需要structure_id映射
+                structure_id_map = self._get_structure_ids(request)
                 self._batch_insert_scores(request, structure_id_map)
             else:
                 # 批量更新记录
@@ -790,6 +913,7 @@ class ScoresService:
             评分表格数据
         """
         try:
+            # 表格只用到权重和已保存的调整后权重，不需要统计构件数量
             weight_data = self._get_weight_data(request)
             if not weight_data:
                 return {"总体评分": 0.00, "评定等级": "暂无", "部位": {}}
@@ -811,11 +935,7 @@ class ScoresService:
                 if saved_scores_data and key in saved_scores_data:
                     adjusted_weight = saved_scores_data[key]["adjusted_weight"]
                 else:
-                    component_count = self._count_components_from_paths(request, item)
-                    custom_count = component_count
-                    adjusted_weight = self._calculate_adjusted_weight(
-                        item["weight"], custom_count
-                    )
+                    adjusted_weight = _ZERO_WEIGHT
 
                 # 部件数据
                 parts_data[part_name]["部件"][component_type_name] = {
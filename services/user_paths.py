@@ -25,6 +25,7 @@ from schemas.inspection_records import PathValidationRequest
 from services.base_crud import BaseCRUDService, PageParams
 from exceptions import NotFoundException, ValidationException, DuplicateException
 from services.inspection_records import get_inspection_records_service
+from utils.cache import cascade_options_cache
 
 
 class UserPathsService(BaseCRUDService[UserPaths, UserPathsCreate, UserPathsUpdate]):
@@ -450,6 +451,7 @@ class UserPathsService(BaseCRUDService[UserPaths, UserPathsCreate, UserPathsUpda
 
             self.session.add(user_path)
             self.session.commit()
+            cascade_options_cache.clear()
             self.session.refresh(user_path)
 
             return self._get_user_path_with_details(user_path.id)
@@ -671,6 +673,7 @@ class UserPathsService(BaseCRUDService[UserPaths, UserPathsCreate, UserPathsUpda
             existing_user_path.updated_at = datetime.now(timezone.utc)
 
             self.session.commit()
+            cascade_options_cache.clear()
             self.session.refresh(existing_user_path)
 
             return self._get_user_path_with_details(user_path_id)
@@ -749,6 +752,7 @@ class UserPathsService(BaseCRUDService[UserPaths, UserPathsCreate, UserPathsUpda
             existing_user_path.updated_at = datetime.now(timezone.utc)
 
             self.session.commit()
+            cascade_options_cache.clear()
 
             print(
                 f"成功删除用户路径 ID: {user_path_id}, 级联删除检查记录: {deleted_records_count} 条"
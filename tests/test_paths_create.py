@@ -0,0 +1,109 @@
+import pytest
+from sqlalchemy import MetaData
+from sqlmodel import Session, SQLModel, create_engine
+
+from exceptions import DatabaseException, DuplicateException
+from models import (
+    BridgeDiseases,
+    BridgeParts,
+    BridgeScales,
+    BridgeTypes,
+    Categories,
+    Paths,
+)
+from models.enums import ScalesType
+from schemas.paths import PathsCreate
+from services.paths import get_paths_service
+from utils.cache import options_cache
+
+
+@pytest.fixture
+def paths_session():
+    """
+    路径创建测试会话fixture，使用内存 SQLite，不创建 MySQL 专用的索引
+    """
+    metadata = MetaData()
+    for table in SQLModel.metadata.sorted_tables:
+        table.to_metadata(metadata).indexes.clear()
+
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    options_cache.clear()
+
+    with Session(engine) as session:
+        session.add_all(
+            [
+                Categories(code="CAT_1", name="类别1"),
+                BridgeTypes(code="BT_1", name="梁桥"),
+                BridgeParts(code="BP_1", name="上部结构"),
+                BridgeDiseases(code="BD_1", name="裂缝"),
+                BridgeScales(
+                    code="BS_1",
+                    name="一类",
+                    scale_type=ScalesType.NUMERIC,
+                    scale_value=1,
+                ),
+                Paths(code="P_EXISTING", name="已有路径"),
+            ]
+        )
+        session.commit()
+        yield session
+
+    options_cache.clear()
+
+
+def _create_data(**overrides) -> dict:
+    """构建路径创建参数"""
+    data = {
+        "code": "",
+        "name": "路径1",
+        "category_code": "CAT_1",
+        "bridge_type_code": "BT_1",
+        "part_code": "BP_1",
+        "disease_code": "BD_1",
+        "scale_code": "BS_1",
+    }
+    data.update(overrides)
+    return data
+
+
+class TestPathsCreate:
+    """路径创建测试类"""
+
+    def test_create_success(self, paths_session):
+        """测试正常创建路径并返回冗余的关联数据"""
+        service = get_paths_service(paths_session)
+
+        result = service.create(PathsCreate(**_create_data()))
+
+        assert result.id is not None
+        assert result.category_name == "类别1"
+        assert result.scale_value == 1
+
+    def test_concurrent_code_is_duplicate(self, paths_session, monkeypatch):
+        """测试并发写入相同编码时报告编码重复"""
+        service = get_paths_service(paths_session)
+        # 模拟编码检查通过后被其他请求抢先写入
+        monkeypatch.setattr(
+            service.code_generator,
+            "assign_or_generate_code",
+            lambda table, code: "P_EXISTING",
+        )
+
+        with pytest.raises(DuplicateException) as exc_info:
+            service.create(PathsCreate(**_create_data()))
+
+        assert "P_EXISTING" in str(exc_info.value)
+
+    def test_other_integrity_error_is_not_duplicate_code(self, paths_session):
+        """测试非编码的完整性错误不会被报告为编码重复"""
+        service = get_paths_service(paths_session)
+        # 跳过校验构建缺少名称的参数，写入时触发 NOT NULL 约束
+        obj_in = PathsCreate.model_construct(**_create_data(name=None))
+
+        with pytest.raises(DatabaseException):
+            service.create(obj_in)
+
+        assert paths_session.exec(
+            Paths.__table__.select().where(Paths.code != "P_EXISTING")
+        ).all() == []
@@ -0,0 +1,39 @@
+from models.enums import ScalesType
+from schemas.paths import PathsResponse
+
+
+class TestPathsResponse:
+    """路径响应模型测试类"""
+
+    def test_model_construct_matches_validation(self):
+        """测试跳过校验构建的响应与校验构建的结果一致"""
+        response_data = {
+            "id": 1,
+            "code": "PATH_1",
+            "name": "路径1",
+            "category_id": 2,
+            "category_code": "CAT_1",
+            "category_name": "类别1",
+            "scale_id": 3,
+            "scale_code": "SC_1",
+            "scale_name": "标度1",
+            "scale_type": ScalesType.RANGE,
+            "min_value": 10,
+            "max_value": 20,
+            "unit": "mm",
+        }
+
+        validated = PathsResponse(**response_data)
+        constructed = PathsResponse.model_construct(**response_data)
+
+        assert constructed.model_dump() == validated.model_dump()
+
+    def test_model_construct_fills_defaults(self):
+        """测试跳过校验构建时未提供的关联字段使用默认值"""
+        response_data = {"id": 1, "code": "PATH_1", "name": "路径1"}
+
+        validated = PathsResponse(**response_data)
+        constructed = PathsResponse.model_construct(**response_data)
+
+        assert constructed.model_dump() == validated.model_dump()
+        assert constructed.quantity_code is None
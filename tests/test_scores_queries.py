@@ -0,0 +1,146 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import MetaData, event
+from sqlmodel import Session, SQLModel, create_engine
+
+from models import (
+    BridgeComponentForms,
+    BridgeComponentTypes,
+    BridgeParts,
+    BridgeTypes,
+    Categories,
+    Paths,
+    UserPaths,
+    WeightReferences,
+)
+from schemas.scores import ScoreListRequest
+from services.scores import get_scores_service
+from utils.cache import cascade_options_cache, options_cache
+
+
+@pytest.fixture
+def scores_session():
+    """
+    评分查询测试会话fixture，使用内存 SQLite，不创建 MySQL 专用的索引
+    """
+    metadata = MetaData()
+    for table in SQLModel.metadata.sorted_tables:
+        table.to_metadata(metadata).indexes.clear()
+
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    options_cache.clear()
+    cascade_options_cache.clear()
+
+    with Session(engine) as session:
+        session.add_all(
+            [
+                BridgeTypes(id=1, code="BT_1", name="梁桥"),
+                BridgeParts(id=1, code="BP_1", name="上部结构"),
+                BridgeParts(id=2, code="BP_2", name="下部结构"),
+                BridgeComponentTypes(id=1, code="CT_1", name="上部承重构件"),
+                BridgeComponentTypes(id=2, code="CT_2", name="桥墩"),
+                BridgeComponentForms(id=1, code="CF_1", name="形式1"),
+                BridgeComponentForms(id=2, code="CF_2", name="-"),
+                Categories(id=1, code="CAT_1", name="类别1"),
+            ]
+        )
+        session.add_all(
+            [
+                Paths(
+                    code=f"P_{index}",
+                    name=f"路径{index}",
+                    bridge_type_id=1,
+                    part_id=part_id,
+                    component_type_id=part_id,
+                    component_form_id=form_id,
+                )
+                for index, (part_id, form_id) in enumerate([(1, 1), (1, 2), (2, 1)])
+            ]
+        )
+        session.add_all(
+            [
+                WeightReferences(
+                    bridge_type_id=1,
+                    part_id=part_id,
+                    component_type_id=part_id,
+                    weight=Decimal("0.50"),
+                )
+                for part_id in (1, 2)
+            ]
+        )
+        session.add(
+            UserPaths(
+                bridge_instance_name="桥梁1",
+                category_id=1,
+                bridge_type_id=1,
+                part_id=1,
+                component_type_id=1,
+                paths_id=1,
+            )
+        )
+        session.commit()
+
+        statements = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+        yield session, statements
+
+    options_cache.clear()
+    cascade_options_cache.clear()
+
+
+class TestScoresQueries:
+    """评分查询次数测试类，防止逐行查询回归"""
+
+    def test_score_list_single_query(self, scores_session):
+        """测试权重列表的权重、构件数量和已保存数据一次查询取回"""
+        session, statements = scores_session
+        service = get_scores_service(session)
+        request = ScoreListRequest(bridge_instance_name="桥梁1", bridge_type_id=1)
+
+        items, total = service.get_score_list(request)
+        assert total == 2
+        assert [item["component_count"] for item in items] == [1, 1]
+
+        # 排除的构件形式ID已缓存，再次查询只执行一条语句
+        statements.clear()
+        service.get_score_list(request)
+        assert len(statements) == 1
+
+    def test_cascade_options_single_query(self, scores_session):
+        """测试级联选项一次查询取回，缓存期内不再查询"""
+        session, statements = scores_session
+        service = get_scores_service(session)
+
+        options = service.get_cascade_options("桥梁1")
+        assert options["bridge_instance_options"] == [{"name": "桥梁1"}]
+        assert len(statements) == 1
+
+        statements.clear()
+        assert service.get_cascade_options("桥梁1") == options
+        assert statements == []
+
+    def test_component_count_skips_missing_forms(self, scores_session):
+        """测试构件形式记录不存在的路径不计入构件数量"""
+        session, _ = scores_session
+        session.add(
+            Paths(
+                code="P_MISSING_FORM",
+                name="路径缺失形式",
+                bridge_type_id=1,
+                part_id=1,
+                component_type_id=1,
+                component_form_id=99,
+            )
+        )
+        session.commit()
+        service = get_scores_service(session)
+        request = ScoreListRequest(bridge_instance_name="桥梁1", bridge_type_id=1)
+
+        items, _ = service.get_score_list(request)
+        assert [item["component_count"] for item in items] == [1, 1]
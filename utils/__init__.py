@@ -5,6 +5,10 @@ from .responses import (
     server_error,
 )
 from .excel import (
+    HEADER_FONT,
+    HEADER_FILL,
+    INSTRUCTION_FONT,
+    build_reference_data_rows,
     create_reference_data_sheet,
     create_help_sheet,
     validate_excel_data,
@@ -14,6 +18,7 @@ from .base import (
     get_reference_data,
     match_name_to_code,
     match_scale_name_to_code,
+    normalize_scale_name,
     parse_range_value,
     get_id_by_code,
     get_damage_type_id_by_name,
@@ -22,12 +27,17 @@ from .base import (
     get_scale_code_by_id,
     get_assessment_units_by_category,
 )
+from .cache import TTLCache, options_cache, cascade_options_cache
 
 __all__ = [
     "success",
     "bad_request",
     "not_found",
     "server_error",
+    "HEADER_FONT",
+    "HEADER_FILL",
+    "INSTRUCTION_FONT",
+    "build_reference_data_rows",
     "create_reference_data_sheet",
     "create_help_sheet",
     "validate_excel_data",
@@ -35,6 +45,7 @@ __all__ = [
     "get_reference_data",
     "match_name_to_code",
     "match_scale_name_to_code",
+    "normalize_scale_name",
     "parse_range_value",
     "get_id_by_code",
     "get_damage_type_id_by_name",
@@ -42,4 +53,7 @@ __all__ = [
     "get_damage_code_by_id",
     "get_scale_code_by_id",
     "get_assessment_units_by_category",
+    "TTLCache",
+    "options_cache",
+    "cascade_options_cache",
 ]
@@ -69,12 +69,20 @@ def match_name_to_code(
     if ref_key not in reference_data:
         return {"matched": False}
 
-    # 处理标度
-    if ref_key == "scale" and session:
-        return match_scale_name_to_code(input_name, session)
-
     ref_dict = reference_data[ref_key]
 
+    # 处理标度，先按标准化后的显示名称匹配，未命中再查询数据库
+    if ref_key == "scale":
+        scale_name = normalize_scale_name(input_name)
+        if scale_name in ref_dict:
+            return {
+                "matched": True,
+                "code": ref_dict[scale_name],
+                "matched_name": scale_name,
+            }
+        if session:
+            return match_scale_name_to_code(input_name, session)
+
     if input_name in ref_dict:
         return {
             "matched": True,
@@ -85,6 +93,31 @@ def match_name_to_code(
     return {"matched": False}
 
 
+def normalize_scale_name(input_value: str) -> str:
+    """
+    将标度输入转换为与选项显示名称一致的格式，如 "3.0" -> "3"，"10.0-20mm" -> "10-20mm"
+
+    Args:
+        input_value: 输入的标度值
+    """
+    input_value = str(input_value).strip()
+
+    try:
+        numeric_value = float(input_value)
+        if numeric_value.is_integer():
+            numeric_value = int(numeric_value)
+        return str(numeric_value)
+    except (ValueError, TypeError):
+        pass
+
+    range_match = parse_range_value(input_value)
+    if range_match:
+        min_value, max_value = range_match["min_value"], range_match["max_value"]
+        return f"{min_value}-{max_value}{range_match['unit']}"
+
+    return input_value
+
+
 def match_scale_name_to_code(input_value: str, session: Session) -> Dict[str, Any]:
     """
     匹配标度值到编码
@@ -0,0 +1,71 @@
+import time
+from threading import Lock
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """进程内带过期时间的简单缓存"""
+
+    def __init__(self, ttl: float = 300, maxsize: Optional[int] = None):
+        """
+        Args:
+            ttl: 缓存有效期（秒）
+            maxsize: 最多缓存的条目数，为空时不限制
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        读取缓存，不存在或已过期时返回 None
+
+        Args:
+            key: 缓存键
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        写入缓存
+
+        Args:
+            key: 缓存键
+            value: 缓存值
+        """
+        now = time.monotonic()
+        with self._lock:
+            if (
+                self.maxsize is not None
+                and key not in self._data
+                and len(self._data) >= self.maxsize
+            ):
+                # 先清理过期条目，仍然已满时淘汰最早写入的条目
+                for expired_key in [
+                    k for k, (expires_at, _) in self._data.items() if expires_at < now
+                ]:
+                    del self._data[expired_key]
+                if len(self._data) >= self.maxsize:
+                    del self._data[next(iter(self._data))]
+            self._data[key] = (now + self.ttl, value)
+
+    def clear(self) -> None:
+        """清空缓存"""
+        with self._lock:
+            self._data.clear()
+
+
+# 基础表选项缓存，基础表或路径数据写入后清空
+options_cache = TTLCache(ttl=300)
+
+# 评分级联选项缓存，按筛选条件缓存，用户路径或基础表写入后清空
+cascade_options_cache = TTLCache(ttl=60, maxsize=256)
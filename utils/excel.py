@@ -1,92 +1,136 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from io import BytesIO
+from itertools import zip_longest
+from openpyxl import load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill
+from openpyxl.utils import get_column_letter
 import traceback
 import pandas as pd
 
+# 模板共用样式，所有单元格共享同一样式对象
+HEADER_FONT = Font(bold=True)
+HEADER_FILL = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+REFERENCE_HEADER_FILL = PatternFill(
+    start_color="E6F3FF", end_color="E6F3FF", fill_type="solid"
+)
+INSTRUCTION_FONT = Font(color="FF0000", italic=True)
+HELP_TITLE_FONT = Font(bold=True, size=14)
+HELP_SECTION_FONT = Font(bold=True, color="0066CC")
+
+
+# 参考数据表的列：(列标题, 选项键)
+REFERENCE_COLUMNS = [
+    ("桥梁类别", "categories"),
+    ("评定单元", "assessment_units"),
+    ("桥梁类型", "bridge_types"),
+    ("部位", "bridge_parts"),
+    ("结构类型", "bridge_structures"),
+    ("部件类型", "bridge_component_types"),
+    ("构件形式", "bridge_component_forms"),
+    ("病害类型", "bridge_diseases"),
+    ("标度", "bridge_scales"),
+    ("定性描述", "bridge_qualities"),
+    ("定量描述", "bridge_quantities"),
+]
+
+
+def build_reference_data_rows(all_options: Dict[str, Any]) -> List[List[Any]]:
+    """
+    将各表选项转换为参考数据表的行，各列长度不同，按行补齐
+
+    Args:
+        all_options: 各表选项
+    """
+    columns = [
+        [option.get("name", "") for option in all_options.get(option_key, [])]
+        for _, option_key in REFERENCE_COLUMNS
+    ]
+    return [list(row) for row in zip_longest(*columns)]
+
+
+def create_reference_data_sheet(
+    ws_ref,
+    all_options: Optional[Dict[str, Any]] = None,
+    rows: Optional[List[List[Any]]] = None,
+):
+    """
+    创建参考数据工作表，按行追加，兼容只写模式的工作表
 
-def create_reference_data_sheet(ws_ref, all_options: Dict[str, Any]):
-    """创建参考数据工作表"""
+    Args:
+        ws_ref: 工作表
+        all_options: 各表选项，未提供 rows 时使用
+        rows: 预先构建好的数据行，见 build_reference_data_rows
+    """
     try:
-        # 定义参考表的列
-        ref_columns = [
-            ("桥梁类别", "categories"),
-            ("评定单元", "assessment_units"),
-            ("桥梁类型", "bridge_types"),
-            ("部位", "bridge_parts"),
-            ("结构类型", "bridge_structures"),
-            ("部件类型", "bridge_component_types"),
-            ("构件形式", "bridge_component_forms"),
-            ("病害类型", "bridge_diseases"),
-            ("标度", "bridge_scales"),
-            ("定性描述", "bridge_qualities"),
-            ("定量描述", "bridge_quantities"),
-        ]
+        if rows is None:
+            rows = build_reference_data_rows(all_options or {})
+
+        # 调整列宽（只写模式下需在写入数据前设置）
+        for col in range(1, len(REFERENCE_COLUMNS) + 1):
+            ws_ref.column_dimensions[get_column_letter(col)].width = 20
 
         # 写入列标题
-        for col, (title, _) in enumerate(ref_columns, 1):
-            cell = ws_ref.cell(row=1, column=col, value=title)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(
-                start_color="E6F3FF", end_color="E6F3FF", fill_type="solid"
-            )
+        header_cells = []
+        for title, _ in REFERENCE_COLUMNS:
+            cell = WriteOnlyCell(ws_ref, value=title)
+            cell.font = HEADER_FONT
+            cell.fill = REFERENCE_HEADER_FILL
+            header_cells.append(cell)
+        ws_ref.append(header_cells)
 
         # 写入数据
-        for col, (title, option_key) in enumerate(ref_columns, 1):
-            if option_key in all_options:
-                options = all_options[option_key]
-                for row, option in enumerate(options, 2):  # 从第2行开始
-                    name = option.get("name", "")
-                    ws_ref.cell(row=row, column=col, value=name)
-
-            # 调整列宽
-            ws_ref.column_dimensions[
-                ws_ref.cell(row=1, column=col).column_letter
-            ].width = 20
+        for row in rows:
+            ws_ref.append(row)
 
     except Exception as e:
         print(f"创建参考数据表时出错: {e}")
 
 
+# 说明工作表内容：(第一列, 第二列)
+HELP_CONTENT = [
+    ["桥梁路径数据导入模板使用说明", ""],
+    ["", ""],
+    ["1. 基本要求", ""],
+    ["• 编码列：可留空，系统自动生成", ""],
+    ["• 名称列：必填，用于标识整条路径", ""],
+    ["• 其他列：请填写与参考数据表完全一致的名称", ""],
+    ["", ""],
+    ["2. 数据填写", ""],
+    ["• 打开'参考数据'工作表查看所有可用选项", ""],
+    ["• 复制粘贴参考数据中的名称，确保完全一致", ""],
+    ["• 注意大小写和空格", ""],
+    ["", ""],
+    ["3. 导入规则", ""],
+    ["• 系统会严格匹配名称", ""],
+    ["• 无法匹配的行将被跳过", ""],
+    ["• 导入后会生成详细报告", ""],
+    ["", ""],
+    ["4. 常见问题", ""],
+    ["• 名称拼写错误 → 检查参考数据表", ""],
+    ["• 多余的空格 → 使用参考数据表复制粘贴", ""],
+    ["• 大小写不匹配 → 严格按照参考数据填写", ""],
+    ["", ""],
+    ["5. 建议操作", ""],
+    ["• 先填写少量数据测试", ""],
+    ["• 使用复制粘贴避免输入错误", ""],
+    ["• 保存备份以便修改", ""],
+]
+
+
 def create_help_sheet(ws_help):
-    """创建说明工作表"""
+    """创建说明工作表，按行追加，兼容只写模式的工作表"""
     try:
-        help_content = [
-            ["桥梁路径数据导入模板使用说明", ""],
-            ["", ""],
-            ["1. 基本要求", ""],
-            ["• 编码列：可留空，系统自动生成", ""],
-            ["• 名称列：必填，用于标识整条路径", ""],
-            ["• 其他列：请填写与参考数据表完全一致的名称", ""],
-            ["", ""],
-            ["2. 数据填写", ""],
-            ["• 打开'参考数据'工作表查看所有可用选项", ""],
-            ["• 复制粘贴参考数据中的名称，确保完全一致", ""],
-            ["• 注意大小写和空格", ""],
-            ["", ""],
-            ["3. 导入规则", ""],
-            ["• 系统会严格匹配名称", ""],
-            ["• 无法匹配的行将被跳过", ""],
-            ["• 导入后会生成详细报告", ""],
-            ["", ""],
-            ["4. 常见问题", ""],
-            ["• 名称拼写错误 → 检查参考数据表", ""],
-            ["• 多余的空格 → 使用参考数据表复制粘贴", ""],
-            ["• 大小写不匹配 → 严格按照参考数据填写", ""],
-            ["", ""],
-            ["5. 建议操作", ""],
-            ["• 先填写少量数据测试", ""],
-            ["• 使用复制粘贴避免输入错误", ""],
-            ["• 保存备份以便修改", ""],
-        ]
-
-        for row, (content1, content2) in enumerate(help_content, 1):
-            ws_help.cell(row=row, column=1, value=content1)
-            ws_help.cell(row=row, column=2, value=content2)
+        # 调整列宽（只写模式下需在写入数据前设置）
+        ws_help.column_dimensions["A"].width = 30
+        ws_help.column_dimensions["B"].width = 50
+
+        for content1, content2 in HELP_CONTENT:
+            cell = WriteOnlyCell(ws_help, value=content1)
 
             # 设置标题样式
             if "说明" in content1:
-                ws_help.cell(row=row, column=1).font = Font(bold=True, size=14)
+                cell.font = HELP_TITLE_FONT
             elif (
                 content1.endswith("要求")
                 or content1.endswith("填写")
@@ -94,16 +138,32 @@ def create_help_sheet(ws_help):
                 or content1.endswith("问题")
                 or content1.endswith("操作")
             ):
-                ws_help.cell(row=row, column=1).font = Font(bold=True, color="0066CC")
+                cell.font = HELP_SECTION_FONT
 
-        # 调整列宽
-        ws_help.column_dimensions["A"].width = 30
-        ws_help.column_dimensions["B"].width = 50
+            ws_help.append([cell, content2])
 
     except Exception as e:
         print(f"创建说明工作表时出错: {e}")
 
 
+# 导入列: (列名, (内部字段名, 参考数据中的键名, 是否为必填项))
+IMPORT_COLUMN_MAPPING = (
+    ("编码", ("code", None, False)),
+    ("名称", ("name", None, True)),
+    ("桥梁类别", ("category_code", "category", True)),
+    ("评定单元", ("assessment_unit_code", "assessment_unit", False)),
+    ("桥梁类型", ("bridge_type_code", "bridge_type", True)),
+    ("部位", ("part_code", "part", True)),
+    ("结构类型", ("structure_code", "structure", False)),
+    ("部件类型", ("component_type_code", "component_type", False)),
+    ("构件形式", ("component_form_code", "component_form", False)),
+    ("病害类型", ("disease_code", "disease", True)),
+    ("标度", ("scale_code", "scale", True)),
+    ("定性描述", ("quality_code", "quality", False)),
+    ("定量描述", ("quantity_code", "quantity", False)),
+)
+
+
 def validate_excel_data(
     file_content: bytes,
     filename: str,
@@ -123,20 +183,26 @@ def validate_excel_data(
         验证结果报告
     """
     try:
-        # 读取Excel文件
-        buffer = BytesIO(file_content)
-
-        # 读取主数据工作表
-        df = pd.read_excel(buffer, sheet_name="路径数据", header=0)
-        df = df.iloc[1:].reset_index(drop=True)  # 去除标题行
-
-        # 删除空白行
-        df = df.dropna(how="all").reset_index(drop=True)
+        # 只读模式流式读取主数据工作表
+        wb = load_workbook(BytesIO(file_content), read_only=True, data_only=True)
+        try:
+            rows_iter = wb["路径数据"].iter_rows(values_only=True)
+            headers = next(rows_iter, ())
+            next(rows_iter, None)  # 去除说明行
+
+            # 删除空白行
+            rows = [
+                dict(zip(headers, values))
+                for values in rows_iter
+                if any(value is not None for value in values)
+            ]
+        finally:
+            wb.close()
 
         # 定义验证结果
         validation_results = {
             "filename": filename,
-            "total_rows": len(df),
+            "total_rows": len(rows),
             "valid_rows": [],
             "invalid_rows": [],
             "errors": [],
@@ -145,7 +211,7 @@ def validate_excel_data(
         }
 
         # 逐行验证
-        for index, row in df.iterrows():
+        for index, row in enumerate(rows):
             row_validation = validate_row(
                 row, index + 3, reference_data, match_name_to_code_func
             )
@@ -166,7 +232,7 @@ def validate_excel_data(
 
 
 def validate_row(
-    row: pd.Series,
+    row: Dict[str, Any],
     row_number: int,
     reference_data: Dict[str, Dict[str, str]],
     match_name_to_code_func,
@@ -192,25 +258,8 @@ def validate_row(
     }
 
     try:
-        column_mapping = {
-            # 列名: (内部字段名, 参考数据中的键名, 是否为必填项)
-            "编码": ("code", None, False),
-            "名称": ("name", None, True),
-            "桥梁类别": ("category_code", "category", True),
-            "评定单元": ("assessment_unit_code", "assessment_unit", False),
-            "桥梁类型": ("bridge_type_code", "bridge_type", True),
-            "部位": ("part_code", "part", True),
-            "结构类型": ("structure_code", "structure", False),
-            "部件类型": ("component_type_code", "component_type", False),
-            "构件形式": ("component_form_code", "component_form", False),
-            "病害类型": ("disease_code", "disease", True),
-            "标度": ("scale_code", "scale", True),
-            "定性描述": ("quality_code", "quality", False),
-            "定量描述": ("quantity_code", "quantity", False),
-        }
-
         # 验证列
-        for col_name, (field_name, ref_key, is_required) in column_mapping.items():
+        for col_name, (field_name, ref_key, is_required) in IMPORT_COLUMN_MAPPING:
             # 获取行数据的值
             value = (
                 str(row.get(col_name, "")).strip()